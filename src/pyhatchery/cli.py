@@ -1,34 +1,39 @@
 """Command-line interface for PyHatchery."""
 
 import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, cast
+from typing import TypedDict, Unpack, cast
 
 import click
 
 from . import __version__
-from .components.config_loader import load_from_env
-from .components.http_client import check_pypi_availability
+from .components.config_loader import load_from_env, start_git_config_async
 from .components.interactive_wizard import (
     COMMON_LICENSES,
     DEFAULT_LICENSE,
     DEFAULT_PYTHON_VERSION,
+    LICENSE_CHOICE,
+    PYTHON_VERSION_CHOICE,
     PYTHON_VERSIONS,
     collect_project_details,
 )
 from .components.name_service import (
-    derive_python_package_slug,
-    has_invalid_characters,
+    analyze_project_name,
     is_valid_python_package_name,
-    pep503_name_ok,
-    pep503_normalize,
 )
 from .components.project_generator import create_base_structure, setup_project_directory
 from .utils.config import str_to_bool
 
+PyPICheckResult = tuple[bool | None, str | None]
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectAuthorDetails:
     """Holds author details for a project."""
 
@@ -37,17 +42,21 @@ class ProjectAuthorDetails:
     github_username: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectNameDetails:
-    """Holds all derived names and warnings for a project."""
+    """Holds all derived names for a project.
+
+    pypi_result is the PyPI check still running in the background, or None
+    in offline mode; finish_name_checks waits for it.
+    """
 
     original_arg: str
     pypi_slug: str
     python_slug: str
-    name_warnings: list[str]
+    pypi_result: Future[PyPICheckResult] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectOptions:
     """Options for project creation."""
 
@@ -61,11 +70,104 @@ class ProjectOptions:
     output_dir: Path | None = None  # Added for custom output location
 
 
+class NewCommandKwargs(TypedDict):
+    """Options Click passes to the `new` command."""
+
+    no_interactive: bool
+    author: str | None
+    email: str | None
+    github_username: str | None
+    description: str | None
+    license_choice: str | None
+    python_version: str | None
+    output_dir_cli: str | None
+
+
+# Non-interactive fields: (detail key, env var, default, CLI option getter)
+_NON_INTERACTIVE_FIELDS: tuple[
+    tuple[str, str, str | None, Callable[[ProjectOptions], str | None]], ...
+] = (
+    ("author_name", "AUTHOR_NAME", None, attrgetter("author.name")),
+    ("author_email", "AUTHOR_EMAIL", None, attrgetter("author.email")),
+    ("github_username", "GITHUB_USERNAME", "", attrgetter("author.github_username")),
+    ("project_description", "PROJECT_DESCRIPTION", "", attrgetter("description")),
+    ("license", "LICENSE", DEFAULT_LICENSE, attrgetter("license_choice")),
+    (
+        "python_version_preference",
+        "PYTHON_VERSION",
+        DEFAULT_PYTHON_VERSION,
+        attrgetter("python_version"),
+    ),
+)
+_REQUIRED_NON_INTERACTIVE_FIELDS = ("author_name", "author_email")
+PYPI_RESULT_TIMEOUT = 5  # seconds to wait for a background PyPI check
+
+
+def check_pypi_availability(package_name: str) -> PyPICheckResult:
+    """Check PyPI availability, loading the HTTP client (and requests) on first use.
+
+    Keeping requests out of the module imports makes `--help` and `--version`
+    start noticeably faster.
+    """
+    from .components.http_client import check_pypi_availability as _check
+
+    return _check(package_name)
+
+
+def _start_pypi_check(pypi_slug: str) -> Future[PyPICheckResult]:
+    """Run check_pypi_availability on a daemon thread.
+
+    Unlike executor workers, a daemon thread is not joined at interpreter
+    exit, so a check already reported as timed out cannot delay the CLI
+    from exiting.
+    """
+    pypi_result: Future[PyPICheckResult] = Future()
+    threading.Thread(
+        target=_run_pypi_check,
+        args=(pypi_slug, pypi_result),
+        name="pypi-check",
+        daemon=True,
+    ).start()
+    return pypi_result
+
+
+def _run_pypi_check(pypi_slug: str, pypi_result: Future[PyPICheckResult]) -> None:
+    """Resolve pypi_result with the PyPI check, reporting errors as a failed check.
+
+    The future is resolved even if the check raises something unexpected, so
+    the CLI never waits out PYPI_RESULT_TIMEOUT for a check that has died.
+    """
+    try:
+        pypi_result.set_result(check_pypi_availability(pypi_slug))
+    except (OSError, ValueError, TypeError) as e:
+        pypi_result.set_result(
+            (None, f"An unexpected error occurred during PyPI check: {e}")
+        )
+    finally:
+        if not pypi_result.done():
+            pypi_result.set_result(
+                (None, "An unexpected error occurred during PyPI check.")
+            )
+
+
 def display_warning(message: str) -> None:
     """Display a warning message."""
     click.secho(f"Warning: {message}", fg="yellow", err=True)
 
 
+def display_warnings(messages: list[str], header: str | None = None) -> None:
+    """Display several warning messages, optionally preceded by a header.
+
+    The block is written with a single call so the terminal is only probed
+    and written to once.
+    """
+    if not messages:
+        return
+    lines = [header] if header else []
+    lines.extend(f"Warning: {message}" for message in messages)
+    click.secho("\n".join(lines), fg="yellow", err=True)
+
+
 def display_error(message: str) -> None:
     """Display an error message."""
     click.secho(f"Error: {message}", fg="red", err=True)
@@ -77,20 +179,37 @@ def validate_project_name(project_name: str, ctx: click.Context) -> ProjectNameD
         display_error("Project name cannot be empty.")
         ctx.exit(1)
 
-    has_invalid, invalid_error = has_invalid_characters(project_name)
-    if has_invalid:
-        display_error(invalid_error)
+    analysis = analyze_project_name(project_name)
+    if analysis.invalid_chars_error:
+        display_error(analysis.invalid_chars_error)
         ctx.exit(1)
 
-    pypi_slug = pep503_normalize(project_name)
-    python_slug = derive_python_package_slug(pypi_slug)
+    pypi_slug = analysis.pypi_slug
+    python_slug = analysis.python_slug
+    offline = ctx.obj.get("OFFLINE", False)
+
+    # Start the PyPI request now; finish_name_checks collects it once the
+    # result is needed, so it overlaps with the rest of the command.
+    pypi_result = None if offline else _start_pypi_check(pypi_slug)
+    _report_derived_names(project_name, pypi_slug, python_slug, analysis.pep503_error)
+
+    return ProjectNameDetails(
+        original_arg=project_name,
+        pypi_slug=pypi_slug,
+        python_slug=python_slug,
+        pypi_result=pypi_result,
+    )
+
 
+def _report_derived_names(
+    project_name: str, pypi_slug: str, python_slug: str, pep503_error: str | None
+) -> None:
+    """Display derived names and any warnings about how they were derived."""
     warnings: list[str] = []
 
     # Check if name is PEP-compliant
-    is_name_ok, name_error_message = pep503_name_ok(project_name)
-    if not is_name_ok:
-        warnings.append(f"Project name '{project_name}': {name_error_message}")
+    if pep503_error:
+        warnings.append(f"Project name '{project_name}': {pep503_error}")
 
     # Notify if name was normalized
     if project_name != pypi_slug:
@@ -101,28 +220,50 @@ def validate_project_name(project_name: str, ctx: click.Context) -> ProjectNameD
     click.secho(f"Derived Python package slug: {python_slug}", fg="blue", err=True)
 
     # Show any warnings
-    for warning in warnings:
-        display_warning(warning)
+    display_warnings(warnings)
 
-    # Check PyPI availability and Python package validity
-    name_warnings = check_name_validity(project_name, pypi_slug, python_slug)
 
-    return ProjectNameDetails(
-        original_arg=project_name,
-        pypi_slug=pypi_slug,
-        python_slug=python_slug,
-        name_warnings=name_warnings,
+def finish_name_checks(name_data: ProjectNameDetails) -> list[str]:
+    """Check PyPI availability and Python package validity for derived names.
+
+    Waits for the background PyPI check started by validate_project_name.
+    """
+    return check_name_validity(
+        name_data.original_arg,
+        name_data.pypi_slug,
+        name_data.python_slug,
+        offline=name_data.pypi_result is None,
+        pypi_result=name_data.pypi_result,
     )
 
 
 def check_name_validity(
-    original_name: str, pypi_slug: str, python_slug: str
+    original_name: str,
+    pypi_slug: str,
+    python_slug: str,
+    offline: bool = False,
+    pypi_result: Future[PyPICheckResult] | None = None,
 ) -> list[str]:
-    """Check PyPI availability and Python package name validity."""
+    """Check PyPI availability and Python package name validity.
+
+    When offline is set, the PyPI check is skipped with a note rather than
+    a warning. If pypi_result is given, the PyPI check already running in
+    the background is awaited instead of starting a new one.
+    """
     warnings: list[str] = []
 
     # Check PyPI availability
-    is_pypi_taken, pypi_error_msg = check_pypi_availability(pypi_slug)
+    if offline:
+        is_pypi_taken, pypi_error_msg = None, None
+        click.secho(
+            f"Offline mode: skipping PyPI availability check for '{pypi_slug}'.",
+            fg="blue",
+            err=True,
+        )
+    elif pypi_result is not None:
+        is_pypi_taken, pypi_error_msg = _await_pypi_result(pypi_result, pypi_slug)
+    else:
+        is_pypi_taken, pypi_error_msg = check_pypi_availability(pypi_slug)
     if pypi_error_msg:
         warnings.append(
             f"PyPI availability check for '{pypi_slug}' failed: {pypi_error_msg}"
@@ -145,24 +286,39 @@ def check_name_validity(
             f"{python_slug_error_msg}"
         )
 
-    if warnings:
-        click.secho(
-            "Problems were found during project name checks. "
-            "You can choose to proceed or cancel.",
-            fg="yellow",
-            err=True,
-        )
-        for warning in warnings:
-            display_warning(warning)
+    display_warnings(
+        warnings,
+        header="Problems were found during project name checks. "
+        "You can choose to proceed or cancel.",
+    )
 
     return warnings
 
 
-def get_project_details(options: ProjectOptions) -> dict[str, str] | None:
-    """Get project details either interactively or non-interactively."""
+def _await_pypi_result(
+    pypi_result: Future[PyPICheckResult], pypi_slug: str
+) -> PyPICheckResult:
+    """Wait for a background PyPI check, treating a slow response as a failure."""
+    try:
+        return pypi_result.result(timeout=PYPI_RESULT_TIMEOUT)
+    except FutureTimeoutError:
+        return None, (
+            f"PyPI check for '{pypi_slug}' timed out. "
+            "Please check your network connection."
+        )
+
+
+def get_project_details(
+    options: ProjectOptions, env_values: dict[str, str] | None = None
+) -> dict[str, str] | None:
+    """Get project details either interactively or non-interactively.
+
+    env_values is the already-parsed .env/environment dict; it is loaded on
+    demand when not supplied.
+    """
 
     if options.no_interactive:
-        return get_non_interactive_details(options)
+        return get_non_interactive_details(options, env_values)
 
     # Create a dictionary of default values from CLI options
     defaults: dict[str, str] = {}
@@ -185,27 +341,17 @@ def get_project_details(options: ProjectOptions) -> dict[str, str] | None:
     )
 
 
-def get_non_interactive_details(options: ProjectOptions) -> dict[str, str] | None:
+def get_non_interactive_details(
+    options: ProjectOptions, env_values: dict[str, str] | None = None
+) -> dict[str, str] | None:
     """Get project details in non-interactive mode."""
-    env_values = load_from_env()
+    if env_values is None:
+        env_values = load_from_env()
     details: dict[str, str] = {}
 
-    # Define fields with their sources (CLI, env, default)
-    field_map: dict[str, tuple[str | None, str, str | None]] = {
-        "author_name": (options.author.name, "AUTHOR_NAME", None),
-        "author_email": (options.author.email, "AUTHOR_EMAIL", None),
-        "github_username": (options.author.github_username, "GITHUB_USERNAME", ""),
-        "project_description": (options.description, "PROJECT_DESCRIPTION", ""),
-        "license": (options.license_choice, "LICENSE", DEFAULT_LICENSE),
-        "python_version_preference": (
-            options.python_version,
-            "PYTHON_VERSION",
-            DEFAULT_PYTHON_VERSION,
-        ),
-    }
-
-    # Populate details from available sources
-    for f, (cli_val, env_key, default_val) in field_map.items():
+    # Populate details from available sources (CLI, env, default)
+    for f, env_key, default_val, get_cli_val in _NON_INTERACTIVE_FIELDS:
+        cli_val = get_cli_val(options)
         if cli_val is not None:
             details[f] = cli_val
         elif env_values.get(env_key) is not None:
@@ -214,21 +360,15 @@ def get_non_interactive_details(options: ProjectOptions) -> dict[str, str] | Non
             details[f] = default_val
 
     # Check for required fields
-    missing_fields = [
-        field for field in ["author_name", "author_email"] if not details.get(field)
-    ]
+    missing_fields = [f for f in _REQUIRED_NON_INTERACTIVE_FIELDS if not details.get(f)]
 
     if missing_fields:
-        display_error(
-            "The following required fields are missing in non-interactive mode:"
-        )
-        for f in missing_fields:
-            click.secho(f"  - {f}", fg="red", err=True)
-        click.secho(
+        lines = [
+            "Error: The following required fields are missing in non-interactive mode:",
+            *(f"  - {f}" for f in missing_fields),
             "Please provide these values via CLI flags or .env file.",
-            fg="red",
-            err=True,
-        )
+        ]
+        click.secho("\n".join(lines), fg="red", err=True)
         return None
 
     return details
@@ -298,18 +438,42 @@ def create_project(
     message="%(prog)s %(version)s",
 )
 @click.option("--debug", is_flag=True, help="Enable debug mode.")
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Skip network checks such as PyPI name availability.",
+)
 @click.pass_context
-def cli(ctx: click.Context, debug: bool):
+def cli(ctx: click.Context, debug: bool, offline: bool):
     """PyHatchery: A Python project scaffolding tool."""
+    ctx.obj = {
+        "DEBUG": debug or _env_flag("PYHATCHERY_DEBUG", "debug mode"),
+        "OFFLINE": offline or _env_flag("PYHATCHERY_OFFLINE", "offline mode"),
+    }
+
+
+def _context_env(ctx: click.Context) -> dict[str, str]:
+    """Return the .env/environment values, reading them on first use.
+
+    The result is kept on ctx.obj so later consumers in the same invocation
+    share it, while commands that never need it (e.g., interactive `new` or
+    `--help`) do not read .env at all.
+    """
+    if "ENV" not in ctx.obj:
+        ctx.obj["ENV"] = load_from_env()
+    return ctx.obj["ENV"]
+
+
+def _env_flag(var_name: str, mode: str) -> bool:
+    """Read a boolean environment variable, warning if it is not a boolean."""
     try:
-        env_debug = str_to_bool(os.environ.get("PYHATCHERY_DEBUG", "false"))
+        return str_to_bool(os.environ.get(var_name, "false"))
     except ValueError:
         display_warning(
-            "Invalid value for PYHATCHERY_DEBUG environment variable. "
-            "Falling back to debug mode being disabled."
+            f"Invalid value for {var_name} environment variable. "
+            f"Falling back to {mode} being disabled."
         )
-        env_debug = False
-    ctx.obj = {"DEBUG": debug or env_debug}
+        return False
 
 
 @cli.command("new")
@@ -326,14 +490,14 @@ def cli(ctx: click.Context, debug: bool):
 @click.option(
     "--license",
     "license_choice",
-    type=click.Choice(COMMON_LICENSES),
+    type=LICENSE_CHOICE,
     default=None,
     help=f"License for the project. Choices: {', '.join(COMMON_LICENSES)}.",
     show_default=f"Defaults to {DEFAULT_LICENSE} if not specified in .env or CLI.",
 )
 @click.option(
     "--python-version",
-    type=click.Choice(PYTHON_VERSIONS),
+    type=PYTHON_VERSION_CHOICE,
     default=None,
     help=f"Python version for the project. Choices: {', '.join(PYTHON_VERSIONS)}.",
     show_default=f"Defaults to {DEFAULT_PYTHON_VERSION} "
@@ -348,25 +512,26 @@ def cli(ctx: click.Context, debug: bool):
     type=click.Path(file_okay=False, dir_okay=True, writable=True, resolve_path=True),
 )
 @click.pass_context
-def new(ctx: click.Context, project_name_arg: str, **kwargs: Any) -> int:
+def new(
+    ctx: click.Context, project_name_arg: str, **kwargs: Unpack[NewCommandKwargs]
+) -> int:
     """Create a new Python project."""
     # Create author details from kwargs
     author_details = ProjectAuthorDetails(
-        name=cast(str | None, kwargs.get("author")),
-        email=cast(str | None, kwargs.get("email")),
-        github_username=cast(str | None, kwargs.get("github_username")),
+        name=kwargs["author"],
+        email=kwargs["email"],
+        github_username=kwargs["github_username"],
     )
 
     # Create options object from kwargs
+    output_dir_cli = kwargs["output_dir_cli"]
     options = ProjectOptions(
-        no_interactive=cast(bool, kwargs.get("no_interactive", False)),
+        no_interactive=kwargs["no_interactive"],
         author=author_details,
-        description=cast(str | None, kwargs.get("description")),
-        license_choice=cast(str | None, kwargs.get("license_choice")),
-        python_version=cast(str | None, kwargs.get("python_version")),
-        output_dir=Path(kwargs["output_dir_cli"])
-        if kwargs.get("output_dir_cli")
-        else None,
+        description=kwargs["description"],
+        license_choice=kwargs["license_choice"],
+        python_version=kwargs["python_version"],
+        output_dir=Path(output_dir_cli) if output_dir_cli else None,
     )
 
     debug_flag = ctx.obj.get("DEBUG", False)
@@ -376,15 +541,26 @@ def new(ctx: click.Context, project_name_arg: str, **kwargs: Any) -> int:
 
     # Set project name in options
     options.project_name = name_data.pypi_slug
-    options.name_warnings = name_data.name_warnings
+    if not options.no_interactive:
+        # Let git read its config while PyPI is awaited; the wizard collects
+        # the output when it asks for author defaults.
+        start_git_config_async()
+        # The wizard starts by asking about name warnings, so wait for PyPI now.
+        options.name_warnings = finish_name_checks(name_data)
 
     # Get project details
     try:
-        project_details = get_project_details(options)
+        project_details = get_project_details(
+            options, _context_env(ctx) if options.no_interactive else None
+        )
     except click.Abort:
         ctx.exit(1)
     if project_details is None:
         ctx.exit(1)
+    if options.no_interactive:
+        # Name warnings are only reported here, so missing details are caught
+        # above without waiting on the network.
+        finish_name_checks(name_data)
 
     # Create the project
     if create_project(name_data, project_details, options.output_dir, debug_flag):
@@ -2,42 +2,197 @@
 Component responsible for loading configuration from various sources.
 """
 
+import atexit
+import functools
 import os
+import re
+import shutil
+import stat
 import subprocess
 from pathlib import Path
 
 from dotenv import dotenv_values
 
+# Resolved once at import; None means git is not installed and no lookups run.
+_GIT_PATH = shutil.which("git")
+
+
+@functools.cache
+def start_git_config_async() -> subprocess.Popen[str] | None:
+    """
+    Starts `git config --list --null` without waiting for it to finish.
+
+    Calling this early (e.g., before the interactive wizard) lets git run
+    while other work happens; the output is collected on the first
+    get_git_config_value call. If it never is, the process is reaped at exit.
+    Repeated calls return the same process handle.
+
+    Returns:
+        The running git process, or None if git could not be started.
+    """
+    if _GIT_PATH is None:
+        return None
+    try:
+        process = _spawn_git_config(_GIT_PATH)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    atexit.register(_reap_git_process, process)
+    return process
+
+
+def _spawn_git_config(git_path: str) -> subprocess.Popen[str]:
+    """
+    Spawns `git config --list --null` with its output piped back to us.
+
+    Args:
+        git_path: The resolved path of the git executable.
+    """
+    return subprocess.Popen(
+        [git_path, "config", "--list", "--null"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+
+
+def _reap_git_process(process: subprocess.Popen[str]) -> None:
+    """
+    Waits for a git process whose output was never read, closing its pipe.
+
+    Args:
+        process: The process started by start_git_config_async.
+    """
+    if process.returncode is not None:
+        return
+    try:
+        process.communicate()
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+
+@functools.cache
+def _load_git_config() -> dict[str, str]:
+    """
+    Reads the whole git configuration with a single `git config --list` call.
+
+    The NUL-separated output format avoids any quoting ambiguity: each record
+    is the key, a newline, then the value.
+
+    Returns:
+        A dictionary mapping normalized keys (see _normalize_git_key) to values.
+        Returns an empty dictionary if git is unavailable or fails.
+    """
+    process = start_git_config_async()
+    if process is None:
+        return {}
+    try:
+        stdout, _ = process.communicate()
+    except (OSError, subprocess.SubprocessError):
+        return {}
+    if process.returncode != 0:
+        return {}
+
+    values: dict[str, str] = {}
+    for record in stdout.split("\0"):
+        if record:
+            key, _, value = record.partition("\n")
+            values[key] = value  # last value wins, as with `git config --get`
+    return values
+
+
+def _normalize_git_key(key: str) -> str:
+    """
+    Normalizes a git config key the way `git config --list` prints it.
+
+    Section and variable names are case-insensitive and printed in lowercase;
+    a subsection (e.g., the "origin" in "remote.origin.url") keeps its case.
+    """
+    section, _, rest = key.partition(".")
+    subsection, dot, name = rest.rpartition(".")
+    return f"{section.lower()}.{subsection}{dot}{name.lower()}"
+
 
 def get_git_config_value(key: str) -> str | None:
     """
     Retrieves a configuration value from git.
 
+    The configuration is read once per process (see _load_git_config), so
+    looking up several keys spawns git only once.
+
     Args:
         key: The git configuration key (e.g., "user.name", "user.email").
 
     Returns:
         The configuration value if found, otherwise None.
     """
-    try:
-        process_result = subprocess.run(
-            ["git", "config", "--get", key],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if process_result.returncode == 0:
-            return process_result.stdout.strip()
-        return None
-    except FileNotFoundError:
-        return None
-    except (
-        OSError,
-        subprocess.SubprocessError,
-        subprocess.CalledProcessError,
-        PermissionError,
-    ):
-        return None
+    return _load_git_config().get(_normalize_git_key(key))
+
+
+# Matches one line of a "simple" .env file: blank lines, comments, and
+# KEY=value / KEY="value" / KEY='value' assignments without escapes or ${}
+# interpolation. Anything else lands in the "other" group and the file is
+# handed to python-dotenv instead.
+_ENV_LINE_RE = re.compile(
+    r"""
+    ^[ \t]*
+    (?:
+        (?:export[ \t]+)?(?P<key>[A-Za-z_][A-Za-z0-9_.-]*)[ \t]*
+        (?:(?P<eq>=)[ \t]*
+            (?:"(?P<dq>[^"\\$\n]*)"
+              |'(?P<sq>[^'$\n]*)'
+              |(?P<raw>[^"'\\$\#\s](?:[^"'\\$\#\n]*[^"'\\$\#\s])?)
+            )?
+        )?
+        (?:[ \t]+\#.*)?
+      | \#.*
+      | (?P<other>.+?)
+    )?
+    [ \t\r]*$
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+
+def _parse_simple_env(text: str) -> dict[str, str] | None:
+    """
+    Parses .env content with _ENV_LINE_RE in a single scan.
+
+    Args:
+        text: The contents of a .env file.
+
+    Returns:
+        The variables defined in the file (keys without a value are skipped,
+        as python-dotenv reports them as None), or None if any line needs
+        python-dotenv's full quoting and interpolation rules.
+    """
+    values: dict[str, str] = {}
+    for key, eq, dq, sq, raw, other in _ENV_LINE_RE.findall(text):
+        if other:
+            return None
+        if eq:
+            values[key] = dq or sq or raw
+    return values
+
+
+@functools.lru_cache(maxsize=16)
+def _read_env_file(env_path: Path, mtime_ns: int) -> dict[str, str]:
+    """
+    Parses a .env file, memoized on its path and modification time.
+
+    Args:
+        env_path: The resolved path to an existing .env file. Resolving keeps
+            the default relative ".env" from hitting another directory's entry.
+        mtime_ns: The file's modification time; a change invalidates the cache.
+
+    Returns:
+        A dictionary of the variables defined in the file.
+    """
+    _ = mtime_ns  # only part of the cache key
+    simple_vars = _parse_simple_env(env_path.read_text(encoding="utf-8"))
+    if simple_vars is not None:
+        return simple_vars
+    loaded_vars = dotenv_values(dotenv_path=env_path)
+    return {k: v for k, v in loaded_vars.items() if v is not None}
 
 
 def load_from_env(env_file_path: str = ".env") -> dict[str, str]:
@@ -54,11 +209,15 @@ def load_from_env(env_file_path: str = ".env") -> dict[str, str]:
     # Start with an empty dictionary
     result: dict[str, str] = {}
 
-    # Load from .env file if it exists
-    env_path = Path(env_file_path)
-    if env_path.is_file():
-        loaded_vars = dotenv_values(dotenv_path=env_path)
-        result.update({k: v for k, v in loaded_vars.items() if v is not None})
+    # Load from .env file if it exists; one stat() answers both "is it a
+    # file?" and "has it changed?"
+    env_path = Path(env_file_path).resolve()
+    try:
+        env_stat = env_path.stat()
+    except OSError:
+        env_stat = None
+    if env_stat is not None and stat.S_ISREG(env_stat.st_mode):
+        result.update(_read_env_file(env_path, env_stat.st_mtime_ns))
 
     # Also check system environment variables for our keys
     # These are the environment variables we care about from cli.py
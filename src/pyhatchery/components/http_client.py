@@ -5,18 +5,95 @@ This module provides functions to interact with external HTTP services,
 primarily for checking package name availability on PyPI.
 """
 
+import json
+import os
+import time
 from http import HTTPStatus
+from pathlib import Path
+from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .name_service import pep503_normalize
 
 PYPI_JSON_URL_TEMPLATE = "https://pypi.org/pypi/{package_name}/json"
 RESPONSE_CUT_OFF = 200
+REQUEST_TIMEOUT = (5, 5)  # (connect, read) seconds
+PYPI_CACHE_TTL = 24 * 3600  # seconds; registrations of new names are rare
+PYPI_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "pyhatchery"
+    / "pypi_names.json"
+)
+
+
+def _create_session() -> requests.Session:
+    """
+    Creates a pooled HTTP session that retries transient PyPI failures.
+
+    Only gateway errors are retried. Connect and read failures are not, so an
+    unreachable PyPI fails after a single REQUEST_TIMEOUT.
+
+    Returns:
+        A requests.Session with a retrying HTTPAdapter mounted for HTTPS.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        connect=0,
+        read=0,
+        backoff_factor=1,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_maxsize=4, max_retries=retries))
+    return session
+
+
+# Shared for the life of the process so repeated checks reuse the TLS connection.
+_SESSION = _create_session()
+
+
+def _load_name_cache() -> dict[str, Any]:
+    """
+    Loads cached PyPI name lookups from disk.
+
+    Returns:
+        The cached entries keyed by package name, or an empty dict if the
+        cache file is missing or unreadable.
+    """
+    try:
+        cache = json.loads(PYPI_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_name_cache(cache: dict[str, Any]) -> None:
+    """
+    Writes PyPI name lookups to disk, ignoring failures.
+
+    Args:
+        cache: The entries to persist, keyed by package name.
+    """
+    try:
+        PYPI_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        PYPI_CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass
 
 
 def check_pypi_availability(package_name: str) -> tuple[bool | None, str | None]:
     """
     Checks if a package name is potentially taken on PyPI.
 
+    Results are cached on disk for PYPI_CACHE_TTL seconds, keyed by the PEP 503
+    normalized name so spellings PyPI treats as equal share one entry. If the
+    live check fails, a previously cached result is returned regardless of
+    its age.
+
     Args:
         package_name: The name of the package to check (e.g., "my-package-name").
 
@@ -31,9 +108,39 @@ def check_pypi_availability(package_name: str) -> tuple[bool | None, str | None]
             - None if the check was successful (200 or 404).
     """
 
+    key = pep503_normalize(package_name)
+    cache = _load_name_cache()
+    entry = cache.get(key)
+    if not isinstance(entry, dict) or not isinstance(entry.get("ts"), (int, float)):
+        entry = None  # malformed entries are ignored and overwritten
+    now = time.time()
+    if entry and now - entry["ts"] < PYPI_CACHE_TTL:
+        return bool(entry.get("taken")), None
+
+    is_taken, error_msg = _query_pypi(package_name)
+    if is_taken is None:
+        if entry:
+            return bool(entry.get("taken")), None
+        return None, error_msg
+
+    cache[key] = {"taken": is_taken, "ts": now}
+    _save_name_cache(cache)
+    return is_taken, None
+
+
+def _query_pypi(package_name: str) -> tuple[bool | None, str | None]:
+    """
+    Queries the PyPI JSON API for a package name, bypassing the cache.
+
+    Args:
+        package_name: The name of the package to check.
+
+    Returns:
+        A tuple (is_taken, error_message), as for check_pypi_availability.
+    """
     url = PYPI_JSON_URL_TEMPLATE.format(package_name=package_name)
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == HTTPStatus.OK:
             return True, None
@@ -7,11 +7,17 @@ import click
 
 from pyhatchery.components.config_loader import get_git_config_value
 
-COMMON_LICENSES: list[str] = ["MIT", "Apache-2.0", "GPL-3.0"]
-PYTHON_VERSIONS: list[str] = ["3.10", "3.11", "3.12"]
+COMMON_LICENSES: tuple[str, ...] = ("MIT", "Apache-2.0", "GPL-3.0")
+PYTHON_VERSIONS: tuple[str, ...] = ("3.10", "3.11", "3.12")
 DEFAULT_PYTHON_VERSION: str = "3.11"
 DEFAULT_LICENSE: str = "MIT"
 
+# Shared by the wizard prompts and the CLI options.
+LICENSE_CHOICE = click.Choice(COMMON_LICENSES)
+PYTHON_VERSION_CHOICE = click.Choice(PYTHON_VERSIONS)
+
+_SEPARATOR = "-" * 30
+
 
 def collect_project_details(
     project_name: str,
@@ -33,9 +39,9 @@ def collect_project_details(
     cli_defaults = cli_defaults or {}
 
     # Display header
-    click.secho("-" * 30, fg="blue")
-    click.secho(f"Configuring project: {project_name}", fg="blue")
-    click.secho("-" * 30, fg="blue")
+    click.secho(
+        f"{_SEPARATOR}\nConfiguring project: {project_name}\n{_SEPARATOR}", fg="blue"
+    )
 
     # If there are name warnings, confirm proceeding
     try:
@@ -84,7 +90,7 @@ def collect_project_details(
         license_choice = click.prompt(
             "License",
             default=cli_defaults.get("license", DEFAULT_LICENSE),
-            type=click.Choice(COMMON_LICENSES),
+            type=LICENSE_CHOICE,
             show_choices=True,
             show_default=True,
         )
@@ -94,7 +100,7 @@ def collect_project_details(
             default=cli_defaults.get(
                 "python_version_preference", DEFAULT_PYTHON_VERSION
             ),
-            type=click.Choice(PYTHON_VERSIONS),
+            type=PYTHON_VERSION_CHOICE,
             show_choices=True,
             show_default=True,
         )
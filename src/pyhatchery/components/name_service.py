@@ -2,14 +2,34 @@
 
 import keyword
 import re
+from dataclasses import dataclass
 
 _PEP503_VALID_RE = re.compile(
     r"^[a-z0-9](?:[a-z0-9._-]*[a-z0-9])?$",
     re.IGNORECASE | re.ASCII,
 )
+_PEP503_INVALID_RE = re.compile(r"[^a-z0-9._-]+")
+_PEP503_SEP_TRANS = str.maketrans("._", "--")
+_DASH_RUN_RE = re.compile(r"-{2,}")
+_PY_SLUG_INVALID_RE = re.compile(r"[^a-zA-Z0-9_]")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+_INVALID_CHARS = "!@#$%^&*+=}{[]|\\/:;\"'<>"
+_INVALID_CHARS_RE = re.compile(f"[{re.escape(_INVALID_CHARS)}]")
+# Matches as soon as a third underscore or dash is seen.
+_TOO_MANY_SEPARATORS_RE = re.compile(r"(?:[^_-]*[_-]){3}")
 _MAX_LEN = 32
 
 
+@dataclass(frozen=True, slots=True)
+class ProjectNameAnalysis:
+    """Result of checking and slugifying a project name in one call."""
+
+    invalid_chars_error: str
+    pypi_slug: str
+    python_slug: str
+    pep503_error: str | None
+
+
 def pep503_normalize(name: str) -> str:
     """Return a PEP 503-compatible normalized slug from the input name.
     Normalization involves:
@@ -29,11 +49,13 @@ def pep503_normalize(name: str) -> str:
     Returns:
         str: The PEP 503-compatible normalized slug.
     """
-    name = name.lower()
-    name = re.sub(r"[^a-z0-9._-]+", "-", name)
-    name = re.sub(r"[-_.]+", "-", name)
-    name = name.strip("-")
-    return name
+    name = name.lower().translate(_PEP503_SEP_TRANS)
+    # Fast path: most names only contain [a-z0-9-] once separators are unified.
+    if not (name.isascii() and name.replace("-", "").isalnum()):
+        name = _PEP503_INVALID_RE.sub("-", name)
+    if "--" in name:
+        name = _DASH_RUN_RE.sub("-", name)
+    return name.strip("-")
 
 
 def derive_python_package_slug(name: str) -> str:
@@ -48,11 +70,24 @@ def derive_python_package_slug(name: str) -> str:
     Returns:
         A string suitable for use as a Python package name or throws ValueError
     """
-    slug = re.sub(r"[^a-zA-Z0-9_]", "_", name)
+    slug = _PY_SLUG_INVALID_RE.sub("_", name)
     slug = slug.lower()
-    slug = re.sub(r"_+", "_", slug)
+    slug = _UNDERSCORE_RUN_RE.sub("_", slug)
     slug = slug.strip("_")
+    return _check_python_slug(slug, name)
 
+
+def _check_python_slug(slug: str, name: str) -> str:
+    """
+    Ensures a derived Python package slug is usable as a package name.
+
+    Args:
+        slug: The derived slug.
+        name: The name the slug was derived from, for error messages.
+
+    Returns:
+        The slug unchanged, or throws ValueError
+    """
     if not slug:
         raise ValueError(
             f"Derived Python package slug from {name} is empty. "
@@ -129,7 +164,7 @@ def pep503_name_ok(project_name: str) -> tuple[bool, str | None]:
             False,
             f"Project name '{project_name}' is too long (max {_MAX_LEN} chars).",
         )
-    if (project_name.count("_") + project_name.count("-")) > 2:
+    if _TOO_MANY_SEPARATORS_RE.match(project_name):
         return False, "Project name contains too many underscores or dashes."
     return True, None
 
@@ -151,12 +186,36 @@ def has_invalid_characters(name: str) -> tuple[bool, str]:
             - has_invalid: True if the name contains invalid characters
             - error_message: The invalid characters found, or the empty string if valid
     """
-    invalid_chars = "!@#$%^&*+=}{[]|\\/:;\"'<>"
+    if not _INVALID_CHARS_RE.search(name):
+        return False, ""
+
+    found = set(_INVALID_CHARS_RE.findall(name))
+    chars_str = ", ".join([f"'{c}'" for c in _INVALID_CHARS if c in found])
+    return True, f"Project name contains invalid characters: {chars_str}"
+
+
+def analyze_project_name(name: str) -> ProjectNameAnalysis:
+    """
+    Runs all project name checks and derivations in a single call.
 
-    found_invalid = [char for char in invalid_chars if char in name]
+    Equivalent to calling has_invalid_characters, pep503_normalize,
+    derive_python_package_slug and pep503_name_ok in turn, but derives the
+    Python slug directly from the PyPI slug (which only contains [a-z0-9-])
+    instead of re-scanning the name.
 
-    if found_invalid:
-        chars_str = ", ".join([f"'{c}'" for c in found_invalid])
-        return True, f"Project name contains invalid characters: {chars_str}"
+    Args:
+        name: The project name as given by the user.
 
-    return False, ""
+    Returns:
+        A ProjectNameAnalysis. If invalid_chars_error is set, the slugs are
+        empty and no other checks were performed. Throws ValueError if the
+        Python slug cannot be derived.
+    """
+    has_invalid, invalid_error = has_invalid_characters(name)
+    if has_invalid:
+        return ProjectNameAnalysis(invalid_error, "", "", None)
+
+    pypi_slug = pep503_normalize(name)
+    python_slug = _check_python_slug(pypi_slug.replace("-", "_"), pypi_slug)
+    _, pep503_error = pep503_name_ok(name)
+    return ProjectNameAnalysis("", pypi_slug, python_slug, pep503_error)
@@ -1,7 +1,8 @@
 "Helper functions for configuration management."
 
-TRUTHY_STRINGS = ["true", "1", "yes"]
-FALSY_STRINGS = ["false", "0", "no"]
+TRUTHY_STRINGS = frozenset({"true", "1", "yes"})
+FALSY_STRINGS = frozenset({"false", "0", "no"})
+_VALID_STRINGS = ", ".join(sorted(TRUTHY_STRINGS | FALSY_STRINGS))
 
 
 def str_to_bool(value: str | None) -> bool:
@@ -22,6 +23,5 @@ def str_to_bool(value: str | None) -> bool:
     if value in FALSY_STRINGS:
         return False
     raise ValueError(
-        f"Invalid boolean string: {value} - "
-        f"must be one of {TRUTHY_STRINGS + FALSY_STRINGS}"
+        f"Invalid boolean string: {value} - must be one of {_VALID_STRINGS}"
     )
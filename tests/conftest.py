@@ -0,0 +1,22 @@
+"""
+Shared pytest fixtures for PyHatchery tests.
+"""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate_pypi_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep PyPI name lookups out of the developer's real cache directory.
+
+    The cache file path is patched for in-process tests, and XDG_CACHE_HOME
+    is set for CLI subprocesses, which compute the path when they start.
+    """
+    cache_home = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    monkeypatch.setattr(
+        "pyhatchery.components.http_client.PYPI_CACHE_FILE",
+        cache_home / "pyhatchery" / "pypi_names.json",
+    )
@@ -5,8 +5,11 @@ This module contains shared helper functions and constants used across test file
 to reduce code duplication and make tests more maintainable.
 """
 
+import functools
+import re
 import subprocess
 import sys
+from collections.abc import Sequence
 from pathlib import Path
 
 # Helper to get the pyhatchery executable
@@ -31,6 +34,30 @@ def run_pyhatchery_command(
     return subprocess.run(command, capture_output=True, text=True, check=False, cwd=cwd)
 
 
+@functools.lru_cache(maxsize=64)
+def _needles_pattern(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile an alternation matching any of the needles literally."""
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+def assert_all_in(haystack: str, needles: Sequence[str]) -> None:
+    """
+    Asserts that every needle occurs in haystack, scanning it once.
+
+    Args:
+        haystack: The text to search, typically captured CLI output
+        needles: The substrings that must all be present
+
+    Raises:
+        AssertionError: If any needle is missing; the message lists them all
+    """
+    found = set(_needles_pattern(tuple(needles)).findall(haystack))
+    # A needle overlapping an earlier match is not reported by findall, so
+    # anything not found in the single scan is double-checked directly.
+    missing = [n for n in needles if n not in found and n not in haystack]
+    assert not missing, f"Missing {missing} in output:\n{haystack}"
+
+
 # Define common CLI arguments used across tests to avoid duplication
 def get_minimal_non_interactive_args(project_name: str) -> list[str]:
     """
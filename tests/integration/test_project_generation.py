@@ -12,6 +12,7 @@ from click.testing import CliRunner
 
 from pyhatchery.cli import cli as pyhatchery_cli
 from tests.helpers import (
+    assert_all_in,
     get_minimal_non_interactive_args,
     get_sample_project_dir_args,
     run_pyhatchery_command,
@@ -45,9 +46,9 @@ def managed_project_base_dir_fixture(tmp_path: Path) -> Generator[Path, None, No
     shutil.rmtree(base_dir)
 
 
-@pytest.fixture(name="runner")
+@pytest.fixture(name="runner", scope="module")
 def runner_fixture():
-    """Fixture that returns a CliRunner instance."""
+    """Fixture that returns a CliRunner instance shared by the module's tests."""
     return CliRunner()
 
 
@@ -136,16 +137,12 @@ class TestProjectGeneration:
         assert project_dir.exists()
         assert (project_dir / "some_file.txt").exists()
 
-        expected_stderr_part1 = f"Error: Project directory '{project_dir}'"
-        expected_stderr_part2 = "already exists and is not empty."
-
-        assert expected_stderr_part1 in result.stderr, (
-            f"Expected part1 ('{expected_stderr_part1}') not in stderr. "
-            f"Stderr: {result.stderr}"
-        )
-        assert expected_stderr_part2 in result.stderr, (
-            f"Expected part2 ('{expected_stderr_part2}') not in stderr. "
-            f"Stderr: {result.stderr}"
+        assert_all_in(
+            result.stderr,
+            [
+                f"Error: Project directory '{project_dir}'",
+                "already exists and is not empty.",
+            ],
         )
 
     def test_fails_if_output_directory_is_a_file(
@@ -171,12 +168,14 @@ class TestProjectGeneration:
             assert result.returncode == 2, (
                 f"Expected failure with code 2, got {result.returncode}"
             )
-            assert (
-                "Error: Invalid value for '-o' / '--output-dir': Directory"
-                in result.stderr
+            assert_all_in(
+                result.stderr,
+                [
+                    "Error: Invalid value for '-o' / '--output-dir': Directory",
+                    f"'{str(file_acting_as_output_dir)}'",
+                    "is a file.",
+                ],
             )
-            assert f"'{str(file_acting_as_output_dir)}'" in result.stderr
-            assert "is a file." in result.stderr
         finally:
             if file_acting_as_output_dir.exists():
                 file_acting_as_output_dir.unlink()
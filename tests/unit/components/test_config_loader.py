@@ -2,15 +2,26 @@
 Unit tests for the config_loader component.
 """
 
+import os
+import stat
 import subprocess
 import unittest
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pyhatchery.components.config_loader import get_git_config_value, load_from_env
+from pyhatchery.components.config_loader import (
+    _load_git_config,
+    _parse_simple_env,
+    _read_env_file,
+    _reap_git_process,
+    get_git_config_value,
+    load_from_env,
+    start_git_config_async,
+)
 
 ENV_CONTENT_VALID = """
 AUTHOR_NAME="Test Env Author"
@@ -22,6 +33,17 @@ PROJECT_DESCRIPTION = "A project from .env"
 
 ENV_CONTENT_EMPTY = ""
 
+GIT_PATH = "/usr/bin/git"
+
+ENV_KEYS = (
+    "AUTHOR_NAME",
+    "AUTHOR_EMAIL",
+    "GITHUB_USERNAME",
+    "PROJECT_DESCRIPTION",
+    "LICENSE",
+    "PYTHON_VERSION",
+)
+
 
 @pytest.fixture(name="temp_env_file")
 def temp_env_file_fixture(
@@ -37,50 +59,122 @@ def temp_env_file_fixture(
     return _create_env_file
 
 
+def _regular_file_stat() -> os.stat_result:
+    """Build the stat() result of a regular file for mocked Path instances."""
+    return os.stat_result((stat.S_IFREG | 0o644, 0, 0, 1, 0, 0, 0, 0, 0, 0))
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_caches():
+    """Reset memoized git config and .env lookups around each test."""
+    cached_functions = (start_git_config_async, _load_git_config, _read_env_file)
+    for cached in cached_functions:
+        cached.cache_clear()
+    yield
+    for cached in cached_functions:
+        cached.cache_clear()
+
+
+@dataclass
+class _FakeGitProcess:
+    """Lightweight stand-in for the Popen handle returned by start_git_config_async."""
+
+    stdout: str
+    returncode: int | None = 0
+    error: Exception | None = None
+    communicate_calls: int = 0
+
+    def communicate(self) -> tuple[str, None]:
+        """Return the canned output like Popen.communicate, or raise error."""
+        self.communicate_calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.stdout, None
+
+
+@patch("pyhatchery.components.config_loader._GIT_PATH", GIT_PATH)
+@patch("subprocess.Popen")
 class TestGetGitConfigValue(unittest.TestCase):
     """Tests for the get_git_config_value function."""
 
-    @patch("subprocess.run")
-    def test_get_git_config_value_success(self, mock_subprocess_run: MagicMock):
-        """Test successfully retrieving a git config value."""
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.stdout = "Test User\n"
-        mock_subprocess_run.return_value = mock_process
+    def test_get_git_config_value_success(self, mock_popen: MagicMock):
+        """Test all keys are read from a single `git config --list` call."""
+        mock_popen.return_value = _FakeGitProcess(
+            "user.name\nTest User\x00"
+            "user.email\ntest@example.com\x00"
+            "init.defaultbranch\nmain\x00"
+            "remote.Origin.url\ngit@example.com:repo.git\x00"
+        )
 
-        result = get_git_config_value("user.name")
-        assert result == "Test User"
-        mock_subprocess_run.assert_called_once_with(
-            ["git", "config", "--get", "user.name"],
-            capture_output=True,
+        assert get_git_config_value("user.name") == "Test User"
+        assert get_git_config_value("user.email") == "test@example.com"
+        assert get_git_config_value("init.defaultBranch") == "main"
+        assert get_git_config_value("remote.Origin.url") == "git@example.com:repo.git"
+        assert get_git_config_value("user.github") is None
+        mock_popen.assert_called_once_with(
+            [GIT_PATH, "config", "--list", "--null"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            check=False,
         )
+        assert mock_popen.return_value.communicate_calls == 1
+
+    def test_started_process_is_reused(self, mock_popen: MagicMock):
+        """Test a process started at CLI entry is consumed on first lookup."""
+        mock_popen.return_value = _FakeGitProcess("user.name\nTest User\x00")
+
+        process = start_git_config_async()
+        assert mock_popen.return_value.communicate_calls == 0
+
+        assert get_git_config_value("user.name") == "Test User"
+        assert start_git_config_async() is process
+        mock_popen.assert_called_once()
+
+    def test_unread_process_is_reaped_at_exit(self, mock_popen: MagicMock):
+        """Test a started process is waited for at exit if nothing reads it."""
+        mock_popen.return_value = _FakeGitProcess("", returncode=None)
 
-    @patch("subprocess.run")
-    def test_get_git_config_value_not_set(self, mock_subprocess_run: MagicMock):
+        with patch("atexit.register") as mock_register:
+            process = start_git_config_async()
+
+        mock_register.assert_called_once_with(_reap_git_process, process)
+        _reap_git_process(process)
+        assert mock_popen.return_value.communicate_calls == 1
+
+    def test_get_git_config_value_multi_valued(self, mock_popen: MagicMock):
+        """Test the last value wins for keys set more than once."""
+        mock_popen.return_value = _FakeGitProcess(
+            "user.name\nGlobal User\x00user.name\nRepo User\x00"
+        )
+
+        assert get_git_config_value("user.name") == "Repo User"
+
+    def test_get_git_config_value_not_set(self, mock_popen: MagicMock):
         """Test when the git config value is not set (git command returns non-zero)."""
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.stdout = ""
-        mock_subprocess_run.return_value = mock_process
+        mock_popen.return_value = _FakeGitProcess("", returncode=1)
 
         result = get_git_config_value("user.nonexistent")
         assert result is None
 
-    @patch("subprocess.run")
-    def test_get_git_config_value_git_not_found(self, mock_subprocess_run: MagicMock):
-        """Test when the git command is not found."""
-        mock_subprocess_run.side_effect = FileNotFoundError
-        result = get_git_config_value("user.name")
-        assert result is None
-
-    @patch("subprocess.run")
-    def test_get_git_config_value_other_subprocess_error(
-        self, mock_subprocess_run: MagicMock
-    ):
+    def test_get_git_config_value_git_not_found(self, mock_popen: MagicMock):
+        """Test when git is not on PATH: no process is started at all."""
+        with patch("pyhatchery.components.config_loader._GIT_PATH", None):
+            assert start_git_config_async() is None
+            assert get_git_config_value("user.name") is None
+            assert get_git_config_value("core.editor") is None
+        mock_popen.assert_not_called()
+
+    def test_get_git_config_value_git_fails_to_start(self, mock_popen: MagicMock):
+        """Test when the git executable cannot be started."""
+        mock_popen.side_effect = PermissionError
+        assert get_git_config_value("user.name") is None
+        mock_popen.assert_called_once()
+
+    def test_get_git_config_value_other_subprocess_error(self, mock_popen: MagicMock):
         """Test handling of other unexpected subprocess errors."""
-        mock_subprocess_run.side_effect = subprocess.SubprocessError("Some error")
+        mock_popen.return_value = _FakeGitProcess(
+            "", error=subprocess.SubprocessError("Some error")
+        )
         result = get_git_config_value("user.name")
         assert result is None
 
@@ -88,35 +182,25 @@ class TestGetGitConfigValue(unittest.TestCase):
 class TestLoadFromEnv:
     """Tests for the load_from_env function."""
 
-    @patch("pyhatchery.components.config_loader.Path")
-    @patch("pyhatchery.components.config_loader.dotenv_values")
     def test_load_from_env_success(
         self,
-        mock_dotenv_values_in_cl: MagicMock,
-        mock_path_in_cl: MagicMock,
         temp_env_file: Callable[..., Path],
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Test successfully loading variables from an .env file."""
-        real_env_file_path_obj = temp_env_file(ENV_CONTENT_VALID)
-        real_env_file_path_str = str(real_env_file_path_obj)
+        env_file = temp_env_file(ENV_CONTENT_VALID)
+        for key in ENV_KEYS:
+            monkeypatch.delenv(key, raising=False)
 
-        mock_path_instance = MagicMock(spec=Path)
-        mock_path_instance.is_file = MagicMock(return_value=True)
-        mock_path_in_cl.return_value = mock_path_instance
+        with patch("pyhatchery.components.config_loader.dotenv_values") as mock_dotenv:
+            result = load_from_env(str(env_file))
 
-        expected_loaded_vars = {
+        mock_dotenv.assert_not_called()
+        assert result == {
             "AUTHOR_NAME": "Test Env Author",
             "AUTHOR_EMAIL": "env@example.com",
             "PROJECT_DESCRIPTION": "A project from .env",
         }
-        mock_dotenv_values_in_cl.return_value = expected_loaded_vars
-
-        result = load_from_env(real_env_file_path_str)
-
-        mock_path_in_cl.assert_called_once_with(real_env_file_path_str)
-        mock_path_instance.is_file.assert_called_once()
-        mock_dotenv_values_in_cl.assert_called_once_with(dotenv_path=mock_path_instance)
-        assert result == expected_loaded_vars
 
     @patch("pyhatchery.components.config_loader.Path")
     @patch("pyhatchery.components.config_loader.dotenv_values")
@@ -130,40 +214,51 @@ class TestLoadFromEnv:
         non_existent_env_file_str = str(tmp_path / "non_existent.env")
 
         mock_path_instance = MagicMock(spec=Path)
-        mock_path_instance.is_file = MagicMock(return_value=False)
+        mock_path_instance.stat.side_effect = FileNotFoundError
+        mock_path_instance.resolve.return_value = mock_path_instance
         mock_path_in_cl.return_value = mock_path_instance
 
         result = load_from_env(non_existent_env_file_str)
 
         mock_path_in_cl.assert_called_once_with(non_existent_env_file_str)
-        mock_path_instance.is_file.assert_called_once()
+        mock_path_instance.stat.assert_called_once()
         mock_dotenv_values_in_cl.assert_not_called()
         assert not result
 
-    @patch("pyhatchery.components.config_loader.Path")
-    @patch("pyhatchery.components.config_loader.dotenv_values")
     def test_load_from_env_empty_file(
         self,
-        mock_dotenv_values_in_cl: MagicMock,
-        mock_path_in_cl: MagicMock,
         temp_env_file: Callable[..., Path],
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Test loading from an empty .env file."""
-        real_env_file_path_obj = temp_env_file(ENV_CONTENT_EMPTY)
-        real_env_file_path_str = str(real_env_file_path_obj)
-
-        mock_path_instance = MagicMock(spec=Path)
-        mock_path_instance.is_file = MagicMock(return_value=True)
-        mock_path_in_cl.return_value = mock_path_instance
-
-        mock_dotenv_values_in_cl.return_value = {}
-
-        result = load_from_env(real_env_file_path_str)
+        env_file = temp_env_file(ENV_CONTENT_EMPTY)
+        for key in ENV_KEYS:
+            monkeypatch.delenv(key, raising=False)
+
+        assert not load_from_env(str(env_file))
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            ('AUTHOR_NAME="Quoted \\"Nick\\" Name"\n', 'Quoted "Nick" Name'),
+            ("AUTHOR_NAME=${LOGNAME_FOR_TEST}\n", "from-interpolation"),
+            ("AUTHOR_NAME='x${LOGNAME_FOR_TEST}y'\n", "xfrom-interpolationy"),
+            ("AUTHOR_NAME=has#hash\n", "has#hash"),
+        ],
+    )
+    def test_load_from_env_falls_back_to_dotenv(
+        self,
+        content: str,
+        expected: str,
+        temp_env_file: Callable[..., Path],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test files beyond the simple KEY=value grammar are parsed by dotenv."""
+        env_file = temp_env_file(content)
+        monkeypatch.delenv("AUTHOR_NAME", raising=False)
+        monkeypatch.setenv("LOGNAME_FOR_TEST", "from-interpolation")
 
-        mock_path_in_cl.assert_called_once_with(real_env_file_path_str)
-        mock_path_instance.is_file.assert_called_once()
-        mock_dotenv_values_in_cl.assert_called_once_with(dotenv_path=mock_path_instance)
-        assert not result
+        assert load_from_env(str(env_file))["AUTHOR_NAME"] == expected
 
     @patch("pyhatchery.components.config_loader.Path")
     @patch("pyhatchery.components.config_loader.dotenv_values")
@@ -174,18 +269,18 @@ class TestLoadFromEnv:
     ):
         """Test loading from default '.env' when it exists."""
         mock_path_instance = MagicMock(spec=Path)
-        mock_path_instance.is_file = MagicMock(return_value=True)
+        mock_path_instance.stat.return_value = _regular_file_stat()
+        mock_path_instance.resolve.return_value = mock_path_instance
+        mock_path_instance.read_text.return_value = "DEFAULT_KEY=DefaultValue\n"
         mock_path_in_cl.return_value = mock_path_instance
 
-        expected_vars_from_dotenv = {"DEFAULT_KEY": "DefaultValue"}
-        mock_dotenv_values_in_cl.return_value = expected_vars_from_dotenv
-
         result = load_from_env()
 
         mock_path_in_cl.assert_called_once_with(".env")
-        mock_path_instance.is_file.assert_called_once()
-        mock_dotenv_values_in_cl.assert_called_once_with(dotenv_path=mock_path_instance)
-        assert result == expected_vars_from_dotenv
+        mock_path_instance.stat.assert_called_once()
+        mock_path_instance.read_text.assert_called_once_with(encoding="utf-8")
+        mock_dotenv_values_in_cl.assert_not_called()
+        assert result == {"DEFAULT_KEY": "DefaultValue"}
 
     @patch("pyhatchery.components.config_loader.Path")
     @patch("pyhatchery.components.config_loader.dotenv_values")
@@ -196,12 +291,64 @@ class TestLoadFromEnv:
     ):
         """Test loading from default '.env' when it does not exist."""
         mock_path_instance = MagicMock(spec=Path)
-        mock_path_instance.is_file = MagicMock(return_value=False)
+        mock_path_instance.stat.side_effect = FileNotFoundError
+        mock_path_instance.resolve.return_value = mock_path_instance
         mock_path_in_cl.return_value = mock_path_instance
 
         result = load_from_env()
 
         mock_path_in_cl.assert_called_once_with(".env")
-        mock_path_instance.is_file.assert_called_once()
+        mock_path_instance.stat.assert_called_once()
         mock_dotenv_values_in_cl.assert_not_called()
         assert not result
+
+    @patch(
+        "pyhatchery.components.config_loader._parse_simple_env",
+        wraps=_parse_simple_env,
+    )
+    def test_load_from_env_cached_until_file_changes(
+        self,
+        mock_parse: MagicMock,
+        temp_env_file: Callable[..., Path],
+    ):
+        """Test the .env file is parsed once and re-read only when modified."""
+        env_file = temp_env_file(ENV_CONTENT_VALID)
+
+        first = load_from_env(str(env_file))
+        second = load_from_env(str(env_file))
+
+        assert first == second
+        mock_parse.assert_called_once()
+
+        mtime_ns = env_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(env_file, ns=(mtime_ns, mtime_ns))
+        load_from_env(str(env_file))
+
+        assert mock_parse.call_count == 2
+
+    def test_load_from_env_default_path_follows_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the cached default '.env' is keyed on the resolved path."""
+        first_dir, second_dir = tmp_path / "first", tmp_path / "second"
+        for directory, author in ((first_dir, "First"), (second_dir, "Second")):
+            directory.mkdir()
+            env_file = directory / ".env"
+            env_file.write_text(f'AUTHOR_NAME="{author}"\n')
+            os.utime(env_file, ns=(0, 0))  # identical mtimes
+        monkeypatch.delenv("AUTHOR_NAME", raising=False)
+
+        monkeypatch.chdir(first_dir)
+        assert load_from_env() == {"AUTHOR_NAME": "First"}
+        monkeypatch.chdir(second_dir)
+        assert load_from_env() == {"AUTHOR_NAME": "Second"}
+
+    def test_load_from_env_ignores_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a directory named '.env' is skipped rather than parsed."""
+        (tmp_path / ".env").mkdir()
+        monkeypatch.delenv("AUTHOR_NAME", raising=False)
+        monkeypatch.chdir(tmp_path)
+
+        assert "AUTHOR_NAME" not in load_from_env()
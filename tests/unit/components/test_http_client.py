@@ -1,17 +1,30 @@
 """Unit tests for the HTTP client component."""
 
+import json
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
 import requests
 
-from pyhatchery.components.http_client import check_pypi_availability
+from pyhatchery.components import http_client
+from pyhatchery.components.http_client import (
+    _SESSION,
+    PYPI_CACHE_TTL,
+    REQUEST_TIMEOUT,
+    check_pypi_availability,
+)
 
 
 class TestHttpClient(unittest.TestCase):
     """Tests for the HTTP client component."""
 
-    @patch("pyhatchery.components.http_client.requests.get")
+    def setUp(self):
+        """Use the throwaway cache file set up by tests/conftest.py."""
+        self.cache_file = http_client.PYPI_CACHE_FILE
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+    @patch("pyhatchery.components.http_client._SESSION.get")
     def test_pypi_name_taken(self, mock_get: MagicMock):
         """Test that a 200 OK response indicates a package name is taken."""
         mock_response = MagicMock()
@@ -23,10 +36,10 @@ class TestHttpClient(unittest.TestCase):
         self.assertTrue(is_taken)
         self.assertIsNone(error_msg)
         mock_get.assert_called_once_with(
-            "https://pypi.org/pypi/existing-package/json", timeout=10
+            "https://pypi.org/pypi/existing-package/json", timeout=REQUEST_TIMEOUT
         )
 
-    @patch("pyhatchery.components.http_client.requests.get")
+    @patch("pyhatchery.components.http_client._SESSION.get")
     def test_pypi_name_available(self, mock_get: MagicMock):
         """Test that a 404 Not Found response indicates a package name is available."""
         mock_response = MagicMock()
@@ -38,10 +51,10 @@ class TestHttpClient(unittest.TestCase):
         self.assertFalse(is_taken)
         self.assertIsNone(error_msg)
         mock_get.assert_called_once_with(
-            "https://pypi.org/pypi/new-package-name/json", timeout=10
+            "https://pypi.org/pypi/new-package-name/json", timeout=REQUEST_TIMEOUT
         )
 
-    @patch("pyhatchery.components.http_client.requests.get")
+    @patch("pyhatchery.components.http_client._SESSION.get")
     def test_pypi_api_error(self, mock_get: MagicMock):
         """Test handling of an unexpected status code from PyPI API."""
         mock_response = MagicMock()
@@ -56,10 +69,10 @@ class TestHttpClient(unittest.TestCase):
         self.assertIn("Unexpected status code: 500", str(error_msg))
         self.assertIn("Internal server error", str(error_msg))
         mock_get.assert_called_once_with(
-            "https://pypi.org/pypi/package-name/json", timeout=10
+            "https://pypi.org/pypi/package-name/json", timeout=REQUEST_TIMEOUT
         )
 
-    @patch("pyhatchery.components.http_client.requests.get")
+    @patch("pyhatchery.components.http_client._SESSION.get")
     def test_network_timeout(self, mock_get: MagicMock):
         """Test handling of a network timeout."""
         mock_get.side_effect = requests.exceptions.Timeout("Connection timed out")
@@ -70,10 +83,10 @@ class TestHttpClient(unittest.TestCase):
         self.assertIsNotNone(error_msg)
         self.assertIn("timed out", str(error_msg))
         mock_get.assert_called_once_with(
-            "https://pypi.org/pypi/package-name/json", timeout=10
+            "https://pypi.org/pypi/package-name/json", timeout=REQUEST_TIMEOUT
         )
 
-    @patch("pyhatchery.components.http_client.requests.get")
+    @patch("pyhatchery.components.http_client._SESSION.get")
     def test_connection_error(self, mock_get: MagicMock):
         """Test handling of a connection error."""
         mock_get.side_effect = requests.exceptions.ConnectionError(
@@ -86,10 +99,10 @@ class TestHttpClient(unittest.TestCase):
         self.assertIsNotNone(error_msg)
         self.assertIn("connection error", str(error_msg))
         mock_get.assert_called_once_with(
-            "https://pypi.org/pypi/package-name/json", timeout=10
+            "https://pypi.org/pypi/package-name/json", timeout=REQUEST_TIMEOUT
         )
 
-    @patch("pyhatchery.components.http_client.requests.get")
+    @patch("pyhatchery.components.http_client._SESSION.get")
     def test_general_request_exception(self, mock_get: MagicMock):
         """Test handling of a general request exception."""
         mock_get.side_effect = requests.exceptions.RequestException(
@@ -103,5 +116,89 @@ class TestHttpClient(unittest.TestCase):
         self.assertIn("unexpected error", str(error_msg))
         self.assertIn("Some other request error", str(error_msg))
         mock_get.assert_called_once_with(
-            "https://pypi.org/pypi/package-name/json", timeout=10
+            "https://pypi.org/pypi/package-name/json", timeout=REQUEST_TIMEOUT
+        )
+
+    def test_session_retries_transient_errors(self):
+        """Test the shared session retries gateway errors, not timeouts."""
+        adapter = _SESSION.get_adapter("https://pypi.org/")
+
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertEqual(adapter.max_retries.connect, 0)
+        self.assertEqual(adapter.max_retries.read, 0)
+
+    @patch("pyhatchery.components.http_client._SESSION.get")
+    def test_cached_result_skips_network(self, mock_get: MagicMock):
+        """Test a fresh cached result is returned without querying PyPI."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        self.assertEqual(check_pypi_availability("cached-package"), (True, None))
+        self.assertEqual(check_pypi_availability("cached-package"), (True, None))
+
+        mock_get.assert_called_once()
+        cached = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        self.assertTrue(cached["cached-package"]["taken"])
+
+    @patch("pyhatchery.components.http_client._SESSION.get")
+    def test_cache_shared_by_equivalent_names(self, mock_get: MagicMock):
+        """Test names PyPI considers equal hit the same cache entry."""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        self.assertEqual(check_pypi_availability("My_Package"), (False, None))
+        self.assertEqual(check_pypi_availability("my.package"), (False, None))
+        self.assertEqual(check_pypi_availability("my-package"), (False, None))
+
+        mock_get.assert_called_once()
+
+    @patch("pyhatchery.components.http_client._SESSION.get")
+    def test_expired_entry_is_refreshed(self, mock_get: MagicMock):
+        """Test an entry older than the TTL triggers a new PyPI query."""
+        self.cache_file.write_text(
+            json.dumps({"old-package": {"taken": True, "ts": 0}}), encoding="utf-8"
+        )
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        is_taken, error_msg = check_pypi_availability("old-package")
+
+        self.assertFalse(is_taken)
+        self.assertIsNone(error_msg)
+        mock_get.assert_called_once()
+
+    @patch("pyhatchery.components.http_client._SESSION.get")
+    def test_stale_entry_used_on_network_error(self, mock_get: MagicMock):
+        """Test a stale cached result is returned when PyPI is unreachable."""
+        stale_ts = time.time() - PYPI_CACHE_TTL - 1
+        self.cache_file.write_text(
+            json.dumps({"stale-package": {"taken": True, "ts": stale_ts}}),
+            encoding="utf-8",
         )
+        mock_get.side_effect = requests.exceptions.ConnectionError("offline")
+
+        is_taken, error_msg = check_pypi_availability("stale-package")
+
+        mock_get.assert_called_once()
+        self.assertTrue(is_taken)
+        self.assertIsNone(error_msg)
+
+    @patch("pyhatchery.components.http_client._SESSION.get")
+    def test_malformed_entry_is_ignored(self, mock_get: MagicMock):
+        """Test an entry with a non-numeric timestamp is treated as missing."""
+        self.cache_file.write_text(
+            json.dumps({"bad-package": {"taken": True, "ts": "x"}}), encoding="utf-8"
+        )
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        is_taken, error_msg = check_pypi_availability("bad-package")
+
+        self.assertFalse(is_taken)
+        self.assertIsNone(error_msg)
+        mock_get.assert_called_once()
@@ -1,11 +1,15 @@
 """Unit tests for the name service component."""
 
 import unittest
+from unittest import mock
 
 from pytest import raises
 
+from pyhatchery.components import name_service
 from pyhatchery.components.name_service import (
+    analyze_project_name,
     derive_python_package_slug,
+    has_invalid_characters,
     is_valid_python_package_name,
     pep503_name_ok,
     pep503_normalize,
@@ -25,6 +29,9 @@ class TestNameService(unittest.TestCase):
             ("my-project", "my-project"),
             ("My--Project__Name", "my-project-name"),
             ("PROJECT", "project"),
+            ("__Leading.And.Trailing--", "leading-and-trailing"),
+            ("My Project!", "my-project"),
+            ("café-app", "caf-app"),
         ]
 
         for input_name, expected_output in test_cases:
@@ -114,6 +121,7 @@ class TestNameService(unittest.TestCase):
             "package.name",
             "package-name123",
             "123package",
+            "my-package_name",
         ]
 
         for name in valid_names:
@@ -131,6 +139,7 @@ class TestNameService(unittest.TestCase):
             ("pack***age", "violates PEP 503"),
             ("package_name_with_too_many_underscores", "too long"),
             ("with___too___many___underscores", "too many underscores"),
+            ("mixed-dash_and-underscore", "too many underscores"),
         ]
 
         for name, reason_fragment in invalid_names_with_reasons:
@@ -149,6 +158,16 @@ class TestNameService(unittest.TestCase):
                         f"should contain '{reason_fragment}'",
                     )
 
+    def test_has_invalid_characters(self):
+        """Test detection and reporting of disallowed characters."""
+        for name in ["my-project", "My_Project", "my.project", "project 123"]:
+            with self.subTest(name=name, valid=True):
+                self.assertEqual(has_invalid_characters(name), (False, ""))
+
+        has_invalid, message = has_invalid_characters("a@b!c@")
+        self.assertTrue(has_invalid)
+        self.assertEqual(message, "Project name contains invalid characters: '!', '@'")
+
     def test_derive_python_package_slug_throws_exception(self):
         """Test handling of invalid project names."""
         # Test with a name that normalizes to an empty string
@@ -182,3 +201,54 @@ class TestNameService(unittest.TestCase):
         # Verify that non-keywords work correctly
         assert derive_python_package_slug("normal_name") == "normal_name"
         assert derive_python_package_slug("project-name") == "project_name"
+
+    def test_analyze_project_name_matches_individual_checks(self):
+        """Test the combined analysis agrees with the individual functions."""
+        names = [
+            "my-project",
+            "My_Project",
+            "My__Project..Name",
+            "with___too___many___underscores",
+            "-package",
+            "project name",
+        ]
+
+        for name in names:
+            with self.subTest(name=name):
+                analysis = analyze_project_name(name)
+                pypi_slug = pep503_normalize(name)
+                self.assertEqual(analysis.invalid_chars_error, "")
+                self.assertEqual(analysis.pypi_slug, pypi_slug)
+                self.assertEqual(
+                    analysis.python_slug, derive_python_package_slug(pypi_slug)
+                )
+                self.assertEqual(analysis.pep503_error, pep503_name_ok(name)[1])
+
+    def test_analyze_project_name_invalid_characters(self):
+        """Test the analysis stops at invalid characters."""
+        analysis = analyze_project_name("bad!name")
+
+        self.assertIn("'!'", analysis.invalid_chars_error)
+        self.assertEqual(analysis.pypi_slug, "")
+        self.assertEqual(analysis.python_slug, "")
+
+        with raises(ValueError, match=".* is a reserved keyword.*"):
+            analyze_project_name("class")
+
+    def test_name_checks_use_precompiled_patterns(self):
+        """Test name checks only use module-level compiled patterns.
+
+        Any call through the re module (re.compile, re.match, ...) at check
+        time would show up on the patched module.
+        """
+        names = ["My__Project..Name", "café-app", "-package", "a_b_c_d", "x" * 40]
+
+        with mock.patch.object(name_service, "re") as mock_re:
+            for name in names:
+                analyze_project_name(name)
+                pep503_name_ok(name)
+                pep503_normalize(name)
+                has_invalid_characters(name)
+                is_valid_python_package_name(name)
+
+        self.assertEqual(mock_re.mock_calls, [])
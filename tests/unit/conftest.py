@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures for PyHatchery unit tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _stub_pypi_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep unit tests off the network by reporting every name as available.
+
+    The CLI starts its PyPI check on a background thread that can outlive the
+    test, so it must never reach pypi.org. Tests that need another result
+    patch pyhatchery.cli.check_pypi_availability themselves.
+    """
+    monkeypatch.setattr(
+        "pyhatchery.cli.check_pypi_availability", lambda _package_name: (False, None)
+    )
@@ -3,7 +3,11 @@ Unit tests for the PyHatchery CLI (Click version).
 These tests use click.testing.CliRunner.
 """
 
+import subprocess
+import sys
+from concurrent.futures import Future
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest import mock
 
 import click
@@ -15,139 +19,265 @@ from pyhatchery.cli import (
     ProjectAuthorDetails,
     ProjectNameDetails,
     ProjectOptions,
+    _run_pypi_check,
+    _start_pypi_check,
     check_name_validity,
     create_project,
+    finish_name_checks,
     get_non_interactive_details,
     get_project_details,
 )
 from pyhatchery.cli import (
     cli as pyhatchery_cli,  # Renamed to avoid conflict with pytest 'cli' fixture
 )
+from tests.helpers import assert_all_in
+
+# Details as returned by the interactive wizard; read-only so a test cannot
+# leak changes into the next one. create_project adds the name fields in
+# place, so anything that reaches it gets a copy from _details().
+_COLLECTED_DETAILS = MappingProxyType(
+    {
+        "author_name": "Test Author",
+        "author_email": "test@example.com",
+        "github_username": "testuser",
+        "project_description": "A test project.",
+        "license": "MIT",
+        "python_version_preference": "3.11",
+    }
+)
+
+
+def _details(**overrides: str) -> dict[str, str]:
+    """Return a fresh copy of _COLLECTED_DETAILS with some fields replaced."""
+    return {**_COLLECTED_DETAILS, **overrides}
+
+
+# Substrings expected on the group and `new` command help screens.
+_GROUP_HELP_EXPECTED = (
+    "Usage: pyhatchery [OPTIONS] COMMAND [ARGS]...",
+    "PyHatchery: A Python project scaffolding tool.",
+    "new",
+)
+_NEW_HELP_EXPECTED = (
+    "Usage: pyhatchery new [OPTIONS] PROJECT_NAME",
+    "Create a new Python project.",
+)
+
+# Values Click passes to the `new` callback when no options are given.
+_NEW_DEFAULTS = MappingProxyType(
+    {
+        "no_interactive": False,
+        "author": None,
+        "email": None,
+        "github_username": None,
+        "description": None,
+        "license_choice": None,
+        "python_version": None,
+        "output_dir_cli": None,
+    }
+)
+
+
+def _make_name_data(project_name: str) -> ProjectNameDetails:
+    """Build the name details validate_project_name returns for a simple name."""
+    return ProjectNameDetails(
+        original_arg=project_name,
+        pypi_slug=project_name.replace("_", "-"),
+        python_slug=project_name.replace("-", "_"),
+    )
+
+
+def _invoke_new(project_name: str, **options: object) -> int:
+    """Call the `new` command callback directly, skipping Click's parsing.
+
+    Unset options get the values Click passes when the flag is omitted. The
+    group context has debug and offline mode off and no .env values.
+    """
+    command = pyhatchery_cli.commands["new"]
+    assert command.callback is not None
+    with click.Context(command, obj={"DEBUG": False, "OFFLINE": False, "ENV": {}}):
+        return command.callback(
+            project_name_arg=project_name, **{**_NEW_DEFAULTS, **options}
+        )
 
 
-@pytest.fixture(name="runner")
+def _patch_cli(monkeypatch: pytest.MonkeyPatch, **replacements: object) -> None:
+    """Replace attributes of pyhatchery.cli until the end of the test."""
+    for name, value in replacements.items():
+        monkeypatch.setattr(f"pyhatchery.cli.{name}", value)
+
+
+@pytest.fixture(name="runner", scope="module")
 def cli_runner() -> CliRunner:
-    """Fixture to provide a CliRunner instance."""
+    """Fixture to provide a CliRunner instance, shared by the module's tests.
+
+    CliRunner keeps no state between invoke() calls, so sharing it is safe.
+    """
     return CliRunner()
 
 
+@pytest.fixture(name="cwd", scope="module")
+def cwd_fixture() -> Path:
+    """Fixture for the working directory, the default project output location.
+
+    Tests that change directory do so through monkeypatch.chdir, which is
+    undone before the next test, so one lookup per module is enough.
+    """
+    return Path.cwd()
+
+
+@pytest.fixture(name="strict_runner", scope="module")
+def strict_runner_fixture() -> CliRunner:
+    """Fixture for tests that only check exit codes and mock calls.
+
+    Exceptions propagate to pytest with their original traceback instead of
+    being stored on the result, and the output is never inspected.
+    """
+    return CliRunner(catch_exceptions=False)
+
+
+# Filesystem steps of project generation. Created once per module and reset
+# before every test by _patch_filesystem; named after the patched functions.
+_FS_MOCKS = SimpleNamespace(
+    setup_project_directory=mock.MagicMock(),
+    create_base_structure=mock.MagicMock(),
+)
+
+
+@pytest.fixture(autouse=True)
+def _patch_filesystem(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep every test from creating project directories on disk."""
+    for fs_mock in vars(_FS_MOCKS).values():
+        fs_mock.reset_mock(return_value=True, side_effect=True)
+    _patch_cli(monkeypatch, **vars(_FS_MOCKS))
+
+
+@pytest.fixture(name="cli_mocks")
+def cli_mocks_fixture(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Fixture replacing the steps of the 'new' command with mocks.
+
+    Tests adjust return values on the namespace attributes, which are named
+    after the patched functions.
+    """
+    mocks = SimpleNamespace(
+        validate_project_name=mock.MagicMock(),
+        get_project_details=mock.MagicMock(return_value=_details()),
+        create_project=mock.MagicMock(return_value=0),
+    )
+    _patch_cli(monkeypatch, **vars(mocks))
+    return mocks
+
+
 class TestBasicFunctionality:
     """Tests for basic CLI functionality like version and help."""
 
-    def test_version_short_flag(self, runner: CliRunner):
-        """Test `pyhatchery -v`."""
-        result = runner.invoke(pyhatchery_cli, ["-v"])
-        assert result.exit_code == 0
-        assert f"pyhatchery {__version__}" in result.output
-        assert result.exception is None
-
-    def test_version_long_flag(self, runner: CliRunner):
-        """Test `pyhatchery --version`."""
-        result = runner.invoke(pyhatchery_cli, ["--version"])
+    @pytest.mark.parametrize("flag", ["-v", "--version"])
+    def test_version_flag(self, flag: str, runner: CliRunner):
+        """Test `pyhatchery -v` and `pyhatchery --version`."""
+        result = runner.invoke(pyhatchery_cli, [flag])
         assert result.exit_code == 0
         assert f"pyhatchery {__version__}" in result.output
         assert result.exception is None
 
-    def test_help_short_flag(self, runner: CliRunner):
-        """Test `pyhatchery -h`."""
-        result = runner.invoke(pyhatchery_cli, ["-h"], prog_name="pyhatchery")
-        assert result.exit_code == 0
-        assert "Usage: pyhatchery [OPTIONS] COMMAND [ARGS]..." in result.output
-        assert "PyHatchery: A Python project scaffolding tool." in result.output
-        assert "new" in result.output
-        assert result.exception is None
-
-    def test_help_long_flag(self, runner: CliRunner):
-        """Test `pyhatchery --help`."""
-        result = runner.invoke(pyhatchery_cli, ["--help"], prog_name="pyhatchery")
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            (["-h"], _GROUP_HELP_EXPECTED),
+            (["--help"], _GROUP_HELP_EXPECTED),
+            (["new", "--help"], _NEW_HELP_EXPECTED),
+        ],
+        ids=["short_flag", "long_flag", "new_command"],
+    )
+    def test_help(self, args: list[str], expected: tuple[str, ...], runner: CliRunner):
+        """Test `pyhatchery -h`, `pyhatchery --help` and `pyhatchery new --help`."""
+        result = runner.invoke(pyhatchery_cli, args, prog_name="pyhatchery")
         assert result.exit_code == 0
-        assert "Usage: pyhatchery [OPTIONS] COMMAND [ARGS]..." in result.output
-        assert "PyHatchery: A Python project scaffolding tool." in result.output
-        assert "new" in result.output
+        assert_all_in(result.output, expected)
         assert result.exception is None
 
-    def test_new_command_help(self, runner: CliRunner):
-        """Test `pyhatchery new --help`."""
-        result = runner.invoke(
-            pyhatchery_cli, ["new", "--help"], prog_name="pyhatchery"
+    def test_cli_import_does_not_load_requests(self):
+        """Test importing the CLI defers loading requests until a PyPI check."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, pyhatchery.cli; print('requests' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
         )
-        assert result.exit_code == 0
-        assert "Usage: pyhatchery new [OPTIONS] PROJECT_NAME" in result.output
-        assert "Create a new Python project." in result.output
-        assert result.exception is None
+        assert result.stdout.strip() == "False"
+
+    @pytest.mark.parametrize(
+        "argv, exit_code, message",
+        [
+            (["new"], 2, "Error: Missing argument 'PROJECT_NAME'."),
+            (
+                ["new", "invalid!name"],
+                1,
+                "Error: Project name contains invalid characters: '!'",
+            ),
+            (["invalidcommand"], 2, "Error: No such command 'invalidcommand'."),
+        ],
+        ids=["no_project_name", "invalid_chars_in_project_name", "invalid_command"],
+    )
+    def test_error_conditions(
+        self, argv: list[str], exit_code: int, message: str, runner: CliRunner
+    ):
+        """Test bad invocations exit with an error code and message."""
+        result = runner.invoke(pyhatchery_cli, argv)
+        assert result.exit_code == exit_code
+        assert message in result.output
+        assert result.exception is not None
 
-    @mock.patch("pyhatchery.cli.create_base_structure")
-    @mock.patch("pyhatchery.cli.collect_project_details")
-    @mock.patch("pyhatchery.cli.setup_project_directory")  # Added this mock
     def test_debug_flag(
         self,
-        mock_setup_dir: mock.MagicMock,  # Added this mock
-        mock_collect_details: mock.MagicMock,
-        mock_create_structure: mock.MagicMock,
         runner: CliRunner,
-        tmp_path: Path,  # Added tmp_path for a unique project dir
+        request: pytest.FixtureRequest,
+        cwd: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Test the --debug flag sets context and is used by subcommands."""
-        mock_collect_details.return_value = {
-            "author_name": "Debug Author",
-            "author_email": "debug@example.com",
-            "github_username": "debug_user",
-            "project_description": "A debug project.",
-            "license": "MIT",
-            "python_version_preference": "3.11",
-        }
-        # Ensure setup_project_directory is mocked to prevent actual dir creation
-        # and to return a predictable path for create_base_structure.
-        project_name = f"testdebug_{tmp_path.name}"  # Unique project name
-        fake_project_path = tmp_path / project_name
-        mock_setup_dir.return_value = fake_project_path
-        # mock_create_structure.return_value not strictly needed if checking calls
+        project_name = f"testdebug_{request.node.name}"  # Unique project name
+        fake_project_path = Path(f"/fake/{project_name}")
+        _FS_MOCKS.setup_project_directory.return_value = fake_project_path
+        mock_collect_details = mock.MagicMock(return_value=_details())
+        _patch_cli(monkeypatch, collect_project_details=mock_collect_details)
 
         result = runner.invoke(
             pyhatchery_cli, ["--debug", "new", project_name], prog_name="pyhatchery"
         )
 
         assert result.exit_code == 0, f"Output: {result.output}"
-        assert "'name_for_processing': 'testdebug-test-debug-flag0'" in result.output
-        assert "'author_name': 'Debug Author'" in result.output
+        assert_all_in(
+            result.output,
+            [
+                "'name_for_processing': 'testdebug-test-debug-flag'",
+                "'author_name': 'Test Author'",
+            ],
+        )
         mock_collect_details.assert_called_once()
-        mock_setup_dir.assert_called_once_with(Path.cwd(), project_name)
-        mock_create_structure.assert_called_once_with(
+        _FS_MOCKS.setup_project_directory.assert_called_once_with(cwd, project_name)
+        _FS_MOCKS.create_base_structure.assert_called_once_with(
             fake_project_path, project_name, project_name
         )
 
-    @mock.patch("pyhatchery.cli.create_base_structure")  # Added mock
-    @mock.patch("pyhatchery.cli.setup_project_directory")  # Added mock
     def test_invalid_pyhatchery_debug_env_var(
         self,
-        mock_setup_dir: mock.MagicMock,  # Added mock
-        mock_create_structure: mock.MagicMock,  # Added mock
         runner: CliRunner,
         monkeypatch: pytest.MonkeyPatch,
-        tmp_path: Path,  # Added tmp_path
+        request: pytest.FixtureRequest,
     ):
         """Test warning when PYHATCHERY_DEBUG env var is invalid."""
         monkeypatch.setenv("PYHATCHERY_DEBUG", "notabool")
-        project_name = f"testenvdebug_{tmp_path.name}"  # Unique project name
-        fake_project_path = tmp_path / project_name
-        mock_setup_dir.return_value = fake_project_path
-
-        _ = mock_create_structure  # avoid unused variable warning
-
-        with mock.patch("pyhatchery.cli.collect_project_details") as mock_collect:
-            mock_collect.return_value = {
-                "author_name": "Test",
-                "author_email": "test@example.com",
-                "license": "MIT",
-                "python_version_preference": "3.11",
-                "github_username": "",
-                "project_description": "",
-            }
-            # mock_create_structure is already patched at the method level
-            # mock_setup_dir is already patched at the method level
-            result = runner.invoke(
-                pyhatchery_cli, ["new", project_name], prog_name="pyhatchery"
-            )
+        project_name = f"testenvdebug_{request.node.name}"  # Unique project name
+
+        # Nothing here is asserted on, so a plain stub stands in for a mock.
+        _patch_cli(monkeypatch, collect_project_details=lambda *_: _details())
+        result = runner.invoke(
+            pyhatchery_cli, ["new", project_name], prog_name="pyhatchery"
+        )
 
         assert result.exit_code == 0
         assert (
@@ -160,223 +290,146 @@ class TestBasicFunctionality:
 class TestNewCommand:
     """Tests for the 'new' command logic."""
 
-    @mock.patch("pyhatchery.cli.create_base_structure")
-    @mock.patch("pyhatchery.cli.collect_project_details")
-    @mock.patch("pyhatchery.cli.check_name_validity")
-    @mock.patch("pyhatchery.cli.setup_project_directory")
     def test_new_interactive_mode_success(
         self,
-        mock_setup_dir: mock.MagicMock,
-        mock_name_checks: mock.MagicMock,
-        mock_collect_details: mock.MagicMock,
-        mock_create_structure: mock.MagicMock,
-        runner: CliRunner,
+        cwd: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
     ):
         """Test `pyhatchery new <name>` in interactive mode (mocked)."""
-        mock_name_checks.return_value = []
-        mock_collect_details.return_value = {
-            "author_name": "Test Author",
-            "author_email": "test@example.com",
-            "github_username": "testuser",
-            "project_description": "A test project.",
-            "license": "MIT",
-            "python_version_preference": "3.11",
-        }
-        mock_setup_dir.return_value = Path("/fake/path/my_interactive_project")
+        _FS_MOCKS.setup_project_directory.return_value = Path(
+            "/fake/path/my_interactive_project"
+        )
+        mock_name_checks = mock.MagicMock(return_value=[])
+        mock_collect_details = mock.MagicMock(return_value=_details())
+        _patch_cli(
+            monkeypatch,
+            check_name_validity=mock_name_checks,
+            collect_project_details=mock_collect_details,
+        )
 
         project_name = "my_interactive_project"
-        result = runner.invoke(pyhatchery_cli, ["new", project_name])
+        assert _invoke_new(project_name) == 0
 
-        assert result.exit_code == 0, f"Output: {result.output}"
-        assert "Creating new project: my-interactive-project" in result.output
+        assert "Creating new project: my-interactive-project" in capsys.readouterr().out
         mock_name_checks.assert_called_once_with(
-            project_name, "my-interactive-project", "my_interactive_project"
+            project_name,
+            "my-interactive-project",
+            "my_interactive_project",
+            offline=False,
+            pypi_result=mock.ANY,
         )
         mock_collect_details.assert_called_once_with("my-interactive-project", [], {})
-        mock_setup_dir.assert_called_once()
-        args, _ = mock_setup_dir.call_args
-        assert args[0] == Path.cwd()
+        _FS_MOCKS.setup_project_directory.assert_called_once()
+        args, _ = _FS_MOCKS.setup_project_directory.call_args
+        assert args[0] == cwd
         assert args[1] == project_name
-        mock_create_structure.assert_called_once_with(
+        _FS_MOCKS.create_base_structure.assert_called_once_with(
             Path("/fake/path/my_interactive_project"),
             "my_interactive_project",
             project_name,
         )
 
-    @mock.patch("pyhatchery.cli.create_base_structure")
-    @mock.patch("pyhatchery.cli.load_from_env")
-    @mock.patch("pyhatchery.cli.check_name_validity")
-    @mock.patch("pyhatchery.cli.setup_project_directory")
     def test_new_non_interactive_mode_all_flags(
         self,
-        mock_setup_dir: mock.MagicMock,
-        mock_name_checks: mock.MagicMock,
-        mock_load_env: mock.MagicMock,
-        mock_create_structure: mock.MagicMock,
-        runner: CliRunner,
-        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
     ):
-        """Test `pyhatchery new <name> --no-interactive` with all flags."""
-        mock_name_checks.return_value = []
-        mock_load_env.return_value = {}
-        custom_output_path = tmp_path / "custom_out"
+        """Test `pyhatchery new <name> --no-interactive` with all options set."""
+        # Never touched on disk: the filesystem steps are mocked.
+        custom_output_path = Path("/virtual/custom_out")
         expected_project_path = custom_output_path / "my_non_interactive_project"
-        mock_setup_dir.return_value = expected_project_path
+        _FS_MOCKS.setup_project_directory.return_value = expected_project_path
+        mock_name_checks = mock.MagicMock(return_value=[])
+        _patch_cli(monkeypatch, check_name_validity=mock_name_checks)
 
         project_name = "my_non_interactive_project"
-        args = [
-            "new",
+        exit_code = _invoke_new(
             project_name,
-            "--no-interactive",
-            "--author",
-            "CLI Author",
-            "--email",
-            "cli@example.com",
-            "--github-username",
-            "cliuser",
-            "--description",
-            "CLI project.",
-            "--license",
-            "Apache-2.0",
-            "--python-version",
-            "3.10",
-            "-o",
-            str(custom_output_path),
-        ]
-        result = runner.invoke(pyhatchery_cli, args)
+            no_interactive=True,
+            author="CLI Author",
+            email="cli@example.com",
+            github_username="cliuser",
+            description="CLI project.",
+            license_choice="Apache-2.0",
+            python_version="3.10",
+            output_dir_cli=str(custom_output_path),
+        )
 
-        assert result.exit_code == 0, f"Output: {result.output}"
-        assert "Creating new project: my-non-interactive-project" in result.output
+        assert exit_code == 0
+        assert (
+            "Creating new project: my-non-interactive-project"
+            in capsys.readouterr().out
+        )
         mock_name_checks.assert_called_once_with(
             project_name,
             "my-non-interactive-project",
             "my_non_interactive_project",
+            offline=False,
+            pypi_result=mock.ANY,
+        )
+        _FS_MOCKS.setup_project_directory.assert_called_once_with(
+            custom_output_path, project_name
         )
-        mock_load_env.assert_called_once()
-        mock_setup_dir.assert_called_once_with(custom_output_path, project_name)
-        mock_create_structure.assert_called_once_with(
+        _FS_MOCKS.create_base_structure.assert_called_once_with(
             expected_project_path, "my_non_interactive_project", project_name
         )
 
-    @mock.patch("pyhatchery.cli.create_project")
-    @mock.patch("pyhatchery.cli.get_project_details")
-    @mock.patch("pyhatchery.cli.validate_project_name")
-    def test_new_command_with_output_dir_short_flag(
+    @pytest.mark.parametrize(
+        "args",
+        [["new", "--help"], ["--offline", "new", "env_project"]],
+        ids=["help", "interactive"],
+    )
+    def test_env_file_read_only_for_non_interactive(
         self,
-        mock_validate_name: mock.MagicMock,
-        mock_get_details: mock.MagicMock,
-        mock_create_project_func: mock.MagicMock,
+        args: list[str],
         runner: CliRunner,
         tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ):
-        """Test `pyhatchery new <name> -o <dir>`."""
-        project_name = "output_dir_project_short"
-        custom_output_dir = tmp_path / "custom_out_short"
-
-        name_data = ProjectNameDetails(
-            original_arg=project_name,
-            pypi_slug="output-dir-project-short",
-            python_slug="output_dir_project_short",
-            name_warnings=[],
-        )
-        mock_validate_name.return_value = name_data
-        mock_get_details.return_value = {
-            "author_name": "Test Author",
-            "author_email": "test@example.com",
-        }
-        mock_create_project_func.return_value = 0
+        """Test commands that don't use .env run even if it is unreadable."""
+        (tmp_path / ".env").write_bytes(b"AUTHOR_NAME=\xff\xfe\n")
+        monkeypatch.chdir(tmp_path)
+        _patch_cli(monkeypatch, collect_project_details=lambda *_: _details())
 
-        args = [
-            "new",
-            project_name,
-            "--no-interactive",
-            "--author",
-            "Test",
-            "--email",
-            "test@example.com",
-            "-o",
-            str(custom_output_dir),
-        ]
         result = runner.invoke(pyhatchery_cli, args)
 
-        assert result.exit_code == 0, f"Output: {result.output}"
-        mock_create_project_func.assert_called_once()
-        call_args = mock_create_project_func.call_args[0]
-        assert call_args[0] == name_data
-        assert call_args[1] == mock_get_details.return_value
-        assert call_args[2] == custom_output_dir
-        assert call_args[3] is False
+        assert result.exit_code == 0, result.output
 
-    @mock.patch("pyhatchery.cli.create_project")
-    @mock.patch("pyhatchery.cli.get_project_details")
-    @mock.patch("pyhatchery.cli.validate_project_name")
-    def test_new_command_with_output_dir_long_flag(
+    @pytest.mark.parametrize("no_interactive", [False, True])
+    def test_git_config_read_only_for_wizard(
         self,
-        mock_validate_name: mock.MagicMock,
-        mock_get_details: mock.MagicMock,
-        mock_create_project_func: mock.MagicMock,
-        runner: CliRunner,
-        tmp_path: Path,
+        no_interactive: bool,
+        cli_mocks: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
     ):
-        """Test `pyhatchery new <name> --output-dir <dir>`."""
-        project_name = "output_dir_project_long"
-        custom_output_dir = tmp_path / "custom_out_long"
-
-        name_data = ProjectNameDetails(
-            original_arg=project_name,
-            pypi_slug="output-dir-project-long",
-            python_slug="output_dir_project_long",
-            name_warnings=[],
-        )
-        mock_validate_name.return_value = name_data
-        mock_get_details.return_value = {
-            "author_name": "Test Author",
-            "author_email": "test@example.com",
-        }
-        mock_create_project_func.return_value = 0
+        """Test git is only started when the interactive wizard will run."""
+        mock_start_git = mock.MagicMock()
+        _patch_cli(monkeypatch, start_git_config_async=mock_start_git)
+        cli_mocks.validate_project_name.return_value = _make_name_data("git_project")
 
-        args = [
-            "new",
-            project_name,
-            "--no-interactive",
-            "--author",
-            "Test",
-            "--email",
-            "test@example.com",
-            "--output-dir",
-            str(custom_output_dir),
-        ]
-        result = runner.invoke(pyhatchery_cli, args)
+        assert _invoke_new("git_project", no_interactive=no_interactive) == 0
 
-        assert result.exit_code == 0, f"Output: {result.output}"
-        mock_create_project_func.assert_called_once()
-        call_args = mock_create_project_func.call_args[0]
-        assert call_args[2] == custom_output_dir
+        assert mock_start_git.called is not no_interactive
 
-    @mock.patch("pyhatchery.cli.create_project")
-    @mock.patch("pyhatchery.cli.get_project_details")
-    @mock.patch("pyhatchery.cli.validate_project_name")
-    def test_new_command_without_output_dir_uses_cwd(
+    @pytest.mark.parametrize(
+        "output_flag",
+        ["-o", "--output-dir", None],
+        ids=["short_flag", "long_flag", "default_cwd"],
+    )
+    def test_new_command_output_dir(
         self,
-        mock_validate_name: mock.MagicMock,
-        mock_get_details: mock.MagicMock,
-        mock_create_project_func: mock.MagicMock,
-        runner: CliRunner,
+        output_flag: str | None,
+        cli_mocks: SimpleNamespace,
+        strict_runner: CliRunner,
     ):
-        """Test `pyhatchery new <name>` uses None for output_dir by default."""
-        project_name = "default_output_dir_project"
-        name_data = ProjectNameDetails(
-            original_arg=project_name,
-            pypi_slug="default-output-dir-project",
-            python_slug="default_output_dir_project",
-            name_warnings=[],
-        )
-        mock_validate_name.return_value = name_data
-        mock_get_details.return_value = {
-            "author_name": "Test Author",
-            "author_email": "test@example.com",
-        }
-        mock_create_project_func.return_value = 0
+        """Test `pyhatchery new <name> [-o|--output-dir <dir>]`.
+
+        Without the flag, None is passed so create_project falls back to the CWD.
+        """
+        project_name = "output_dir_project"
+        name_data = _make_name_data(project_name)
+        cli_mocks.validate_project_name.return_value = name_data
 
         args = [
             "new",
@@ -387,217 +440,260 @@ class TestNewCommand:
             "--email",
             "test@example.com",
         ]
-        result = runner.invoke(pyhatchery_cli, args)
+        expected_output_dir = None
+        if output_flag:
+            expected_output_dir = Path("/virtual/custom_out")
+            args += [output_flag, str(expected_output_dir)]
+        result = strict_runner.invoke(pyhatchery_cli, args)
 
-        assert result.exit_code == 0, f"Output: {result.output}"
-        mock_create_project_func.assert_called_once()
-        call_args = mock_create_project_func.call_args[0]
-        assert call_args[2] is None
+        assert result.exit_code == 0
+        cli_mocks.create_project.assert_called_once()
+        call_args = cli_mocks.create_project.call_args[0]
+        assert call_args[0] == name_data
+        assert call_args[1] == cli_mocks.get_project_details.return_value
+        assert call_args[2] == expected_output_dir
+        assert call_args[3] is False
 
-    @mock.patch("pyhatchery.cli.setup_project_directory")
-    @mock.patch("pyhatchery.cli.create_base_structure")
-    def test_create_project_file_exists_error(
+    @pytest.mark.parametrize(
+        "setup_error, create_error",
+        [
+            (FileExistsError("Directory already exists"), None),
+            (OSError("Permission denied during setup"), None),
+            (None, OSError("Permission denied during create_base")),
+        ],
+        ids=["file_exists", "os_error_from_setup", "os_error_from_create_base"],
+    )
+    def test_create_project_error_paths(
         self,
-        mock_create_base_structure: mock.MagicMock,
-        mock_setup_project_directory: mock.MagicMock,
-        runner: CliRunner,
+        setup_error: OSError | None,
+        create_error: OSError | None,
+        cwd: Path,
     ):
-        """Test FileExistsError handling in create_project."""
-        _ = runner
-        mock_setup_project_directory.side_effect = FileExistsError(
-            "Directory already exists"
-        )
-
-        name_data = ProjectNameDetails(
-            original_arg="test_project",
-            pypi_slug="test-project",
-            python_slug="test_project",
-            name_warnings=[],
-        )
-        project_details = {
-            "author_name": "Test Author",
-            "author_email": "test@example.com",
-            "project_name_original": "test_project",
-            "python_package_slug": "test_project",
-        }
+        """Test create_project reports failures from either generation step."""
+        fake_project_root = Path("/fake/project/root")
+        _FS_MOCKS.setup_project_directory.return_value = fake_project_root
+        _FS_MOCKS.setup_project_directory.side_effect = setup_error
+        _FS_MOCKS.create_base_structure.side_effect = create_error
 
         result_code = create_project(
-            name_data, project_details, output_dir=None, debug=False
+            _make_name_data("test_project"),
+            _details(),
+            output_dir=None,
+            debug=False,
         )
 
         assert result_code == 1
-        mock_setup_project_directory.assert_called_once_with(Path.cwd(), "test_project")
-        mock_create_base_structure.assert_not_called()
+        _FS_MOCKS.setup_project_directory.assert_called_once_with(cwd, "test_project")
+        if setup_error is None:
+            _FS_MOCKS.create_base_structure.assert_called_once_with(
+                fake_project_root, "test_project", "test_project"
+            )
+        else:
+            _FS_MOCKS.create_base_structure.assert_not_called()
 
-    @mock.patch("pyhatchery.cli.setup_project_directory")
-    @mock.patch("pyhatchery.cli.create_base_structure")
-    def test_create_project_os_error_from_setup(
+
+class TestProjectNameValidation:
+    """Tests for project name validation logic."""
+
+    @pytest.fixture(autouse=True)
+    def _silence_secho(self, monkeypatch: pytest.MonkeyPatch):
+        """Discard the slug/warning output these tests never inspect."""
+        monkeypatch.setattr("pyhatchery.cli.click.secho", lambda *_, **__: None)
+
+    @pytest.mark.parametrize(
+        "pypi_ret, slug_ret, expected_warnings",
+        [
+            ((False, None), (True, None), []),
+            ((True, None), (True, None), ["might already be taken on PyPI"]),
+            (
+                (None, "Network error"),
+                (True, None),
+                ["PyPI availability check for 'test-name' failed: Network error"],
+            ),
+            ((False, None), (False, "Not valid"), ["is not PEP 8 compliant"]),
+            (
+                (True, None),
+                (False, "Not valid"),
+                ["might already be taken on PyPI", "is not PEP 8 compliant"],
+            ),
+        ],
+        ids=["no_warnings", "pypi_taken", "pypi_error", "invalid_slug", "all"],
+    )
+    def test_check_name_validity_warnings(
         self,
-        mock_create_base_structure: mock.MagicMock,
-        mock_setup_project_directory: mock.MagicMock,
-        runner: CliRunner,
+        pypi_ret: tuple[bool | None, str | None],
+        slug_ret: tuple[bool, str | None],
+        expected_warnings: list[str],
+        monkeypatch: pytest.MonkeyPatch,
     ):
-        """Test OSError from setup_project_directory in create_project."""
-        _ = runner
-        mock_setup_project_directory.side_effect = OSError(
-            "Permission denied during setup"
+        """Test each combination of PyPI and slug results in check_name_validity."""
+        _patch_cli(
+            monkeypatch,
+            check_pypi_availability=lambda _: pypi_ret,
+            is_valid_python_package_name=lambda _: slug_ret,
         )
 
-        name_data = ProjectNameDetails(
-            original_arg="test_os_error_setup",
-            pypi_slug="test-os-error-setup",
-            python_slug="test_os_error_setup",
-            name_warnings=[],
-        )
-        project_details = {
-            "author_name": "Test Author",
-            "author_email": "test@example.com",
-            "project_name_original": "test_os_error_setup",
-            "python_package_slug": "test_os_error_setup",
-        }
-        custom_output = Path("/custom/output/dir")
-        result_code = create_project(
-            name_data, project_details, output_dir=custom_output, debug=False
-        )
+        warnings = check_name_validity("test_name", "test-name", "test_name")
 
-        assert result_code == 1
-        mock_setup_project_directory.assert_called_once_with(
-            custom_output, "test_os_error_setup"
-        )
-        mock_create_base_structure.assert_not_called()
+        assert len(warnings) == len(expected_warnings)
+        for warning, expected in zip(warnings, expected_warnings, strict=True):
+            assert expected in warning
 
-    @mock.patch("pyhatchery.cli.setup_project_directory")
-    @mock.patch("pyhatchery.cli.create_base_structure")
-    def test_create_project_os_error_from_create_base(
-        self,
-        mock_create_base_structure: mock.MagicMock,
-        mock_setup_project_directory: mock.MagicMock,
-        runner: CliRunner,
+    def test_check_name_validity_offline_skips_pypi(
+        self, monkeypatch: pytest.MonkeyPatch
     ):
-        """Test OSError from create_base_structure in create_project."""
-        _ = runner
-        fake_project_root = Path("/fake/project/root")
-        mock_setup_project_directory.return_value = fake_project_root
-        mock_create_base_structure.side_effect = OSError(
-            "Permission denied during create_base"
-        )
+        """Test offline mode skips the PyPI check without adding a warning."""
+        mock_check_pypi = mock.MagicMock()
+        _patch_cli(monkeypatch, check_pypi_availability=mock_check_pypi)
 
-        name_data = ProjectNameDetails(
-            original_arg="test_os_error_create",
-            pypi_slug="test-os-error-create",
-            python_slug="test_os_error_create",
-            name_warnings=[],
+        warnings = check_name_validity(
+            "test_name", "test-name", "test_name", offline=True
         )
-        project_details = {
-            "author_name": "Test Author",
-            "author_email": "test@example.com",
-            "project_name_original": "test_os_error_create",
-            "python_package_slug": "test_os_error_create",
-        }
 
-        result_code = create_project(
-            name_data, project_details, output_dir=None, debug=False
-        )
+        assert not warnings
+        mock_check_pypi.assert_not_called()
 
-        assert result_code == 1
-        mock_setup_project_directory.assert_called_once_with(
-            Path.cwd(), "test_os_error_create"
+    def test_check_name_validity_uses_background_result(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a PyPI check already in flight is awaited instead of re-run."""
+        mock_check_pypi = mock.MagicMock()
+        _patch_cli(monkeypatch, check_pypi_availability=mock_check_pypi)
+        pypi_result: Future[tuple[bool | None, str | None]] = Future()
+        pypi_result.set_result((True, None))
+
+        warnings = check_name_validity(
+            "test_name", "test-name", "test_name", pypi_result=pypi_result
         )
-        mock_create_base_structure.assert_called_once_with(
-            fake_project_root, "test_os_error_create", "test_os_error_create"
+
+        assert len(warnings) == 1
+        assert "might already be taken on PyPI" in warnings[0]
+        mock_check_pypi.assert_not_called()
+
+    def test_check_name_validity_background_timeout(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a background PyPI check that does not finish is reported."""
+        _patch_cli(monkeypatch, PYPI_RESULT_TIMEOUT=0)
+
+        warnings = check_name_validity(
+            "test_name", "test-name", "test_name", pypi_result=Future()
         )
 
+        assert len(warnings) == 1
+        assert "timed out" in warnings[0]
 
-class TestErrorConditions:
-    """Tests for CLI error conditions."""
+    def test_start_pypi_check_returns_result(self, monkeypatch: pytest.MonkeyPatch):
+        """Test the background PyPI check resolves with the check's result."""
+        _patch_cli(monkeypatch, check_pypi_availability=lambda _: (True, None))
 
-    def test_new_command_no_project_name(self, runner: CliRunner):
-        """Test `pyhatchery new` without a project name."""
-        result = runner.invoke(pyhatchery_cli, ["new"])
-        assert result.exit_code == 2
-        assert "Error: Missing argument 'PROJECT_NAME'." in result.output
-        assert result.exception is not None
+        assert _start_pypi_check("test-name").result(timeout=5) == (True, None)
 
-    def test_new_command_invalid_chars_in_project_name(self, runner: CliRunner):
-        """Test `pyhatchery new` with invalid characters in project name."""
-        result = runner.invoke(pyhatchery_cli, ["new", "invalid!name"])
-        assert result.exit_code == 1
-        assert "Error: Project name contains invalid characters: '!'" in result.output
-
-    def test_invalid_command(self, runner: CliRunner):
-        """Test an invalid command."""
-        result = runner.invoke(pyhatchery_cli, ["invalidcommand"])
-        assert result.exit_code == 2
-        assert "Error: No such command 'invalidcommand'." in result.output
-        assert result.exception is not None
+    def test_start_pypi_check_reports_errors(self, monkeypatch: pytest.MonkeyPatch):
+        """Test a check that raises resolves as a failure instead of hanging."""
 
+        def failing_check(_package_name: str) -> tuple[bool | None, str | None]:
+            raise OSError("disk full")
 
-class TestProjectNameValidation:
-    """Tests for project name validation logic."""
+        _patch_cli(monkeypatch, check_pypi_availability=failing_check)
 
-    @mock.patch("pyhatchery.cli.check_pypi_availability")
-    @mock.patch("pyhatchery.cli.is_valid_python_package_name")
-    def test_check_name_validity_with_multiple_warnings(
-        self,
-        mock_is_valid_python_package: mock.MagicMock,
-        mock_check_pypi: mock.MagicMock,
-        runner: CliRunner,
+        is_taken, error_msg = _start_pypi_check("test-name").result(timeout=5)
+
+        assert is_taken is None
+        assert error_msg == "An unexpected error occurred during PyPI check: disk full"
+
+    def test_run_pypi_check_resolves_on_unexpected_error(
+        self, monkeypatch: pytest.MonkeyPatch
     ):
-        """Test all warning scenarios in check_name_validity."""
-        mock_check_pypi.return_value = (True, None)
-        mock_is_valid_python_package.return_value = (False, "Not valid")
+        """Test the future is resolved even when the error is not handled."""
+
+        def failing_check(_package_name: str) -> tuple[bool | None, str | None]:
+            raise KeyError("ts")
 
-        _ = runner
+        _patch_cli(monkeypatch, check_pypi_availability=failing_check)
+        pypi_result: Future[tuple[bool | None, str | None]] = Future()
 
-        original_name = "test_name"
-        pypi_slug = "test-name"
-        python_slug = "test_name"
+        with pytest.raises(KeyError):
+            _run_pypi_check("test-name", pypi_result)
 
-        with mock.patch("pyhatchery.cli.click.secho") as mock_secho:
-            warnings = check_name_validity(original_name, pypi_slug, python_slug)
+        assert pypi_result.result(timeout=0) == (
+            None,
+            "An unexpected error occurred during PyPI check.",
+        )
+
+    def test_finish_name_checks_awaits_background_result(self):
+        """Test finish_name_checks reports the background PyPI result."""
+        pypi_result: Future[tuple[bool | None, str | None]] = Future()
+        pypi_result.set_result((True, None))
+        name_data = _make_name_data("test_name")
+        name_data.pypi_result = pypi_result
 
-        _ = mock_secho
-        assert len(warnings) == 2
-        assert any("might already be taken on PyPI" in w for w in warnings)
-        assert any("is not PEP 8 compliant" in w for w in warnings)
+        warnings = finish_name_checks(name_data)
+
+        assert len(warnings) == 1
+        assert "might already be taken on PyPI" in warnings[0]
 
-    @mock.patch("pyhatchery.cli.check_pypi_availability")
-    def test_check_name_validity_pypi_error(
-        self, mock_check_pypi: mock.MagicMock, runner: CliRunner
+    def test_finish_name_checks_offline(self, monkeypatch: pytest.MonkeyPatch):
+        """Test finish_name_checks skips PyPI when no check was started."""
+        mock_check_pypi = mock.MagicMock()
+        _patch_cli(monkeypatch, check_pypi_availability=mock_check_pypi)
+
+        assert not finish_name_checks(_make_name_data("test_name"))
+        mock_check_pypi.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "global_args,env",
+        [(["--offline"], {}), ([], {"PYHATCHERY_OFFLINE": "true"})],
+    )
+    def test_offline_mode_passed_to_name_checks(
+        self,
+        global_args: list[str],
+        env: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
     ):
-        """Test PyPI check error path in check_name_validity."""
-        mock_check_pypi.return_value = (None, "Network error")
+        """Test --offline and PYHATCHERY_OFFLINE both enable offline mode."""
+        mock_name_checks = mock.MagicMock(return_value=[])
+        _patch_cli(
+            monkeypatch,
+            check_name_validity=mock_name_checks,
+            get_project_details=lambda *_: None,
+        )
 
-        _ = runner
+        CliRunner().invoke(
+            pyhatchery_cli, [*global_args, "new", "offline_project"], env=env
+        )
 
-        with mock.patch("pyhatchery.cli.click.secho"):
-            warnings = check_name_validity("test_name", "test-name", "test_name")
+        assert mock_name_checks.call_args.kwargs == {
+            "offline": True,
+            "pypi_result": None,
+        }
 
-        assert len(warnings) == 1
-        assert "PyPI availability check" in warnings[0]
-        assert "failed: Network error" in warnings[0]
+    def test_non_interactive_missing_details_skip_pypi_wait(
+        self, cli_mocks: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test non-interactive runs fail on missing details before name checks."""
+        mock_name_checks = mock.MagicMock(return_value=[])
+        _patch_cli(monkeypatch, check_name_validity=mock_name_checks)
+        cli_mocks.validate_project_name.return_value = _make_name_data("test_project")
+        cli_mocks.get_project_details.return_value = None
+
+        with pytest.raises(click.exceptions.Exit):
+            _invoke_new("test_project", no_interactive=True)
+
+        mock_name_checks.assert_not_called()
 
-    @mock.patch("pyhatchery.cli.get_project_details")
-    @mock.patch("pyhatchery.cli.validate_project_name")
     def test_new_command_get_project_details_returns_none(
-        self,
-        mock_validate_name: mock.MagicMock,
-        mock_get_details: mock.MagicMock,
-        runner: CliRunner,
+        self, cli_mocks: SimpleNamespace
     ):
         """Test handling when get_project_details returns None."""
-        name_data = ProjectNameDetails(
-            original_arg="test_project",
-            pypi_slug="test-project",
-            python_slug="test_project",
-            name_warnings=[],
-        )
-        mock_validate_name.return_value = name_data
-        mock_get_details.return_value = None
+        cli_mocks.validate_project_name.return_value = _make_name_data("test_project")
+        cli_mocks.get_project_details.return_value = None
 
-        with mock.patch.object(click.Context, "exit") as mock_exit:
-            _ = runner.invoke(pyhatchery_cli, ["new", "test_project"])
-            mock_exit.assert_any_call(1)
+        with pytest.raises(click.exceptions.Exit) as excinfo:
+            _invoke_new("test_project")
+
+        assert excinfo.value.exit_code == 1
+        cli_mocks.create_project.assert_not_called()
 
 
 class TestNonInteractiveDetails:
@@ -742,6 +838,20 @@ class TestNonInteractiveDetails:
         result = get_non_interactive_details(options)
         assert result is None
 
+    @mock.patch("pyhatchery.cli.load_from_env")
+    def test_preloaded_env_values_used(self, mock_load_env: mock.MagicMock) -> None:
+        """Test env values passed in are used instead of re-reading .env."""
+        env_values = {"AUTHOR_NAME": "Env Author", "AUTHOR_EMAIL": "env@example.com"}
+
+        result = get_non_interactive_details(
+            ProjectOptions(no_interactive=True), env_values
+        )
+
+        assert result is not None
+        assert result["author_name"] == "Env Author"
+        assert result["author_email"] == "env@example.com"
+        mock_load_env.assert_not_called()
+
     @mock.patch("pyhatchery.cli.collect_project_details")
     def test_get_project_details_abort(
         self,
@@ -805,15 +915,15 @@ class TestNonInteractiveDetails:
         result = get_non_interactive_details(options)
         assert result is not None
 
-        # Verify values were populated from environment
-        assert result["author_name"] == "Env Author"
-        assert result["author_email"] == "env@example.com"
-        assert result["license"] == "GPL-3.0"
-        assert result["python_version_preference"] == "3.8"
-
-        # Optional fields should be empty
-        assert result["github_username"] == ""
-        assert result["project_description"] == ""
+        # Values come from the environment; optional fields stay empty
+        assert result == _details(
+            author_name="Env Author",
+            author_email="env@example.com",
+            github_username="",
+            project_description="",
+            license="GPL-3.0",
+            python_version_preference="3.8",
+        )
 
     @mock.patch("pyhatchery.cli.validate_project_name")
     @mock.patch("pyhatchery.cli.collect_project_details")
@@ -821,47 +931,22 @@ class TestNonInteractiveDetails:
         self,
         mock_collect: mock.MagicMock,
         mock_validate: mock.MagicMock,
-        runner: CliRunner,
     ) -> None:
         """Test click.Abort handling with exit in new command."""
-        # Set up mocks
-        mock_validate.return_value = ProjectNameDetails(
-            original_arg="test_project",
-            pypi_slug="test-project",
-            python_slug="test_project",
-            name_warnings=[],
-        )
+        mock_validate.return_value = _make_name_data("test_project")
         mock_collect.side_effect = click.Abort()
 
-        # Run with mocked context exit
-        with mock.patch.object(click.Context, "exit") as mock_exit:
-            runner.invoke(pyhatchery_cli, ["new", "test_project"])
-            mock_exit.assert_called_with(1)
+        with pytest.raises(click.exceptions.Exit) as excinfo:
+            _invoke_new("test_project")
 
-    @mock.patch("pyhatchery.cli.create_project")  # Added this line
-    @mock.patch("pyhatchery.cli.validate_project_name")
-    @mock.patch("pyhatchery.cli.get_project_details")
-    def test_new_command_create_project_returns_error(
-        self,
-        mock_get_details: mock.MagicMock,
-        mock_validate_name: mock.MagicMock,
-        mock_create_project: mock.MagicMock,
-        runner: CliRunner,
-    ):
+        assert excinfo.value.exit_code == 1
+
+    def test_new_command_create_project_returns_error(self, cli_mocks: SimpleNamespace):
         """Test handling when create_project returns an error code."""
-        name_data = ProjectNameDetails(
-            original_arg="test_project",
-            pypi_slug="test-project",
-            python_slug="test_project",
-            name_warnings=[],
-        )
-        mock_validate_name.return_value = name_data
-        mock_get_details.return_value = {
-            "author_name": "Test",
-            "author_email": "test@example.com",
-        }
-        mock_create_project.return_value = 1
+        cli_mocks.validate_project_name.return_value = _make_name_data("test_project")
+        cli_mocks.create_project.return_value = 1
+
+        with pytest.raises(click.exceptions.Exit) as excinfo:
+            _invoke_new("test_project")
 
-        with mock.patch.object(click.Context, "exit") as mock_exit:
-            _ = runner.invoke(pyhatchery_cli, ["new", "test_project"])
-            mock_exit.assert_any_call(1)
+        assert excinfo.value.exit_code == 1
@@ -25,3 +25,11 @@ class TestUtils(unittest.TestCase):
         # Test invalid strings
         with self.assertRaises(ValueError):
             str_to_bool("invalid")
+
+    def test_str_to_bool_case_insensitive(self):
+        """Test conversion ignores case and lists valid values on error."""
+        self.assertTrue(str_to_bool("YES"))
+        self.assertFalse(str_to_bool("False"))
+
+        with self.assertRaisesRegex(ValueError, "must be one of 0, 1, false, no"):
+            str_to_bool("maybe")